@@ -51,6 +51,15 @@ class ChemDrawDocument(object):
     with open(cdx_properties_path, 'r') as stream:
         CDX_PROPERTIES = yaml.safe_load(stream)
     PROPERTY_NAME_TO_TAG = {value["name"]: key for key, value in CDX_PROPERTIES.items()}
+    # tag ids as they are written to cdx, eg. for the attribute of a represent element
+    PROPERTY_NAME_TO_TAG_BYTES = {name: tag_id.to_bytes(2, byteorder='little', signed=True)
+                                  for name, tag_id in PROPERTY_NAME_TO_TAG.items()}
+    TAG_BYTES_TO_PROPERTY_NAME = {key.to_bytes(2, byteorder='little', signed=True): value["name"]
+                                  for key, value in CDX_PROPERTIES.items()}
+    # tag id bytes and type class for writing a cdxml attribute to cdx.
+    # Properties with a type that is not implemented are missing and hence treated as unknown attributes.
+    PROPERTY_NAME_TO_TYPE = {value["name"]: (key.to_bytes(2, byteorder='little'), globals()[value["type"]])
+                             for key, value in CDX_PROPERTIES.items() if value["type"] in globals()}
 
     def __init__(self, cdxml: ET.ElementTree, max_object_id=5000, document_id=None):
         self.cdxml = cdxml
@@ -267,12 +276,10 @@ class ChemDrawDocument(object):
     @staticmethod
     def _attribute_to_stream(attrib: str, value: str, stream: io.BytesIO, ignore_unknown_attribute: bool):
         try:
-            tag_id = ChemDrawDocument.PROPERTY_NAME_TO_TAG[attrib]
-            chemdraw_type = ChemDrawDocument.CDX_PROPERTIES[tag_id]['type']
-            klass = globals()[chemdraw_type]
+            tag_bytes, klass = ChemDrawDocument.PROPERTY_NAME_TO_TYPE[attrib]
             type_obj = klass.from_string(value)
             logger.debug(f"Writing attribute {attrib} with value '{value}'.")
-            stream.write(tag_id.to_bytes(2, byteorder='little'))
+            stream.write(tag_bytes)
             ChemDrawDocument._type_to_stream(type_obj, stream)
         except KeyError:
             logger.error(f"Found unknown attribute '{attrib} with value '{value}'. Ignoring attribute.")
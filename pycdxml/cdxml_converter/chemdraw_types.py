@@ -5,12 +5,18 @@ from pathlib import Path
 from enum import Enum
 import logging
 import struct
+import functools
+import numpy as np
 import pycdxml.cdxml_converter.chemdraw_objects
 import base64
 import platform
 
 logger = logging.getLogger('pycdxml.chemdraw_types')
 
+# little-endian signed ints of the Connectivity, SequenceType, SideType and PositioningAngle types
+_INT16 = struct.Struct("<h")
+_INT32 = struct.Struct("<i")
+
 
 def decode_options(value: int, options: dict) -> str:
     """
@@ -817,8 +823,6 @@ class CDXAminoAcidTermini(CDXType, Enum):
     NH2COOH = 2
 
     def __init__(self, value: int):
-        if 1 > value > 2:
-            raise ValueError("Currently only 2 values allowed: 1 or 2.")
         self.termini = value
 
     @staticmethod
@@ -840,8 +844,7 @@ class CDXAminoAcidTermini(CDXType, Enum):
         return self.termini.to_bytes(1, byteorder='little', signed=False)
 
     def to_property_value(self) -> str:
-        val = str(CDXAminoAcidTermini(self.termini))
-        return val.split('.')[1]
+        return self.name
 
 
 class CDXAutonumberStyle(CDXType, Enum):
@@ -850,8 +853,6 @@ class CDXAutonumberStyle(CDXType, Enum):
     Alphabetic = 2
 
     def __init__(self, value: int):
-        if 0 > value > 2:
-            raise ValueError("Currently only 3 values allowed: 0-2.")
         self.autonumber_style = value
 
     @staticmethod
@@ -869,8 +870,7 @@ class CDXAutonumberStyle(CDXType, Enum):
         return self.autonumber_style.to_bytes(1, byteorder='little', signed=False)
 
     def to_property_value(self) -> str:
-        val = str(CDXAutonumberStyle(self.autonumber_style))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXBondSpacing(CDXType):
@@ -907,8 +907,6 @@ class CDXDoubleBondPosition(CDXType, Enum):
     Left_m = 258  # Double bond is on the left (viewing from the "begin" atom to the "end" atom), and was positioned manually by the user
 
     def __init__(self, value: int):
-        if 0 > value > 258:
-            raise ValueError("Needs to be in [0,1,2,256,257,258].")
         self.double_bond_position = value
 
     @staticmethod
@@ -926,10 +924,8 @@ class CDXDoubleBondPosition(CDXType, Enum):
         return self.double_bond_position.to_bytes(2, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXDoubleBondPosition(self.double_bond_position))
-        val = val.split('.')[1]  # only actually value without enum name
-        val = val.replace("_m", "")  # cdxml only has 3 values, hence remove the trailing _m
-        return val
+        # cdxml only has 3 values, hence remove the trailing _m
+        return self.name.replace("_m", "")
 
 
 class CDXBondDisplay(CDXType, Enum):
@@ -950,8 +946,6 @@ class CDXBondDisplay(CDXType, Enum):
     DashDot = 14
 
     def __init__(self, value: int):
-        if 0 > value > 14:
-            raise ValueError("Needs to be between 0 and 14")
         self.bond_display = value
 
     @staticmethod
@@ -969,8 +963,7 @@ class CDXBondDisplay(CDXType, Enum):
         return self.bond_display.to_bytes(2, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXBondDisplay(self.bond_display))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXAtomStereo(CDXType, Enum):
@@ -998,8 +991,6 @@ class CDXAtomStereo(CDXType, Enum):
     u = 6
 
     def __init__(self, value: int):
-        if 0 > value > 6:
-            raise ValueError("Needs to be between 0-6")
         self.atom_stereo = value
 
     @staticmethod
@@ -1017,8 +1008,7 @@ class CDXAtomStereo(CDXType, Enum):
         return self.atom_stereo.to_bytes(1, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXAtomStereo(self.atom_stereo))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXBondStereo(CDXType, Enum):
@@ -1038,8 +1028,6 @@ class CDXBondStereo(CDXType, Enum):
     Z = 3
 
     def __init__(self, value: int):
-        if 0 > value > 3:
-            raise ValueError("Needs to be between 0-3")
         self.bond_stereo = value
 
     @staticmethod
@@ -1057,8 +1045,7 @@ class CDXBondStereo(CDXType, Enum):
         return self.bond_stereo.to_bytes(1, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXBondStereo(self.bond_stereo))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 # class INT(CDXType):
@@ -1378,8 +1365,7 @@ class CDXBracketUsage(CDXType):
         return val + self.additional_bytes
 
     def to_property_value(self) -> str:
-        val = str(CDXBracketUsage.BracketUsage(self.bracket_usage))
-        return val.split('.')[1]  # only actually value without enum name
+        return CDXBracketUsage.BracketUsage(self.bracket_usage).name
 
     class BracketUsage(Enum):
         Unspecified = 0
@@ -1412,8 +1398,6 @@ class CDXBracketType(CDXType, Enum):
     Round = 5
 
     def __init__(self, value: int):
-        if 0 > value > 5:
-            raise ValueError("Needs to be between 0-5")
         self.bracket_type = value
 
     @staticmethod
@@ -1431,8 +1415,7 @@ class CDXBracketType(CDXType, Enum):
         return self.bracket_type.to_bytes(2, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXBracketType(self.bracket_type))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXGraphicType(CDXType, Enum):
@@ -1446,8 +1429,6 @@ class CDXGraphicType(CDXType, Enum):
     Symbol = 7
 
     def __init__(self, value: int):
-        if 0 > value > 7:
-            raise ValueError("Needs to be between 0-7")
         self.graphic_type = value
 
     @staticmethod
@@ -1465,8 +1446,7 @@ class CDXGraphicType(CDXType, Enum):
         return self.graphic_type.to_bytes(2, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXGraphicType(self.graphic_type))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXArrowType(CDXType):
@@ -1508,8 +1488,6 @@ class CDXArrowHeadType(CDXType, Enum):
     Angle = 3
 
     def __init__(self, value: int):
-        if 0 > value > 3:
-            raise ValueError("Needs to be between 0-3")
         self.arrow_type = value
 
     @staticmethod
@@ -1527,8 +1505,7 @@ class CDXArrowHeadType(CDXType, Enum):
         return self.arrow_type.to_bytes(2, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXArrowHeadType(self.arrow_type))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXArrowHeadPosition(CDXType, Enum):
@@ -1541,8 +1518,6 @@ class CDXArrowHeadPosition(CDXType, Enum):
     HalfLeft = 3
 
     def __init__(self, value: int):
-        if 0 > value > 4:
-            raise ValueError("Needs to be between 0-4")
         self.arrow_type = value
 
     @staticmethod
@@ -1563,8 +1538,7 @@ class CDXArrowHeadPosition(CDXType, Enum):
         if self.arrow_type == 1:
             return "None"
         else:
-            val = str(CDXArrowHeadPosition(self.arrow_type))
-            return val.split('.')[1]  # only actually value without enum name
+            return self.name
 
 
 class CDXFillType(CDXType):
@@ -1608,8 +1582,6 @@ class CDXJustification(CDXType, Enum):
     Best = 6
 
     def __init__(self, value: int):
-        if -1 > value > 6:
-            raise ValueError("Needs to be between -1 and 6")
         self.label_justification = value
 
     @staticmethod
@@ -1627,8 +1599,7 @@ class CDXJustification(CDXType, Enum):
         return self.label_justification.to_bytes(1, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXJustification(self.label_justification))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXBondOrder(CDXType):
@@ -1698,8 +1669,6 @@ class CDXLabelAlignment(CDXType, Enum):
     Best = 6
 
     def __init__(self, value: int):
-        if -1 > value > 6:
-            raise ValueError("Needs to be between 0 and 6")
         self.label_alignment = value
 
     @staticmethod
@@ -1717,8 +1686,7 @@ class CDXLabelAlignment(CDXType, Enum):
         return self.label_alignment.to_bytes(1, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXLabelAlignment(self.label_alignment))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXLineHeight(CDXType):
@@ -1763,6 +1731,12 @@ class CDXLineHeight(CDXType):
             return 'variable'
         elif self.value == 1:
             return 'auto'
+        elif self.value % 2 == 0:
+            # exactly representable with 1 decimal, format with integer arithmetic
+            tenths = self.value // 2
+            whole, fraction = divmod(abs(tenths), 10)
+            sign = '-' if tenths < 0 else ''
+            return f"{sign}{whole}.{fraction}"
         else:
             return str(round(self.value / 20, 1))
 
@@ -1787,8 +1761,6 @@ class CDXAtomGeometry(CDXType, Enum):
     m_10 = 16
 
     def __init__(self, value: int):
-        if -1 > value > 16:
-            raise ValueError("Needs to be between 0 and 6")
         self.geometry = value
 
     @staticmethod
@@ -1801,16 +1773,18 @@ class CDXAtomGeometry(CDXType, Enum):
     @staticmethod
     def from_string(value: str) -> 'CDXAtomGeometry':
         if value.isdigit():
-            value = 'm_' + value
+            return _ATOM_GEOMETRY_BY_NUMBER[value]
         return CDXAtomGeometry[value]
 
     def to_bytes(self) -> bytes:
         return self.geometry.to_bytes(1, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXAtomGeometry(self.geometry))
-        prop_val = val.split('.')[1]  # only actually value without enum name
-        return prop_val.replace("m_", "")
+        return self.name.replace("m_", "")
+
+
+# numeric geometries like '5' are stored as 'm_5' as enum names can't start with a digit
+_ATOM_GEOMETRY_BY_NUMBER = {member.name[2:]: member for member in CDXAtomGeometry if member.name.startswith("m_")}
 
 
 class CDXNodeType(CDXType, Enum):
@@ -1831,8 +1805,6 @@ class CDXNodeType(CDXType, Enum):
     Monomer = 14
 
     def __init__(self, value: int):
-        if -1 > value > 13:
-            raise ValueError("Needs to be between 0 and 13")
         self.node_type = value
 
     @staticmethod
@@ -1850,8 +1822,7 @@ class CDXNodeType(CDXType, Enum):
         return self.node_type.to_bytes(2, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXNodeType(self.node_type))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXSymbolType(CDXType, Enum):
@@ -1871,8 +1842,6 @@ class CDXSymbolType(CDXType, Enum):
     LonePair_2 = 13
 
     def __init__(self, value: int):
-        if -1 > value > 13:
-            raise ValueError("Needs to be between 0 and 13")
         self.symbol_type = value
 
     @staticmethod
@@ -1894,8 +1863,7 @@ class CDXSymbolType(CDXType, Enum):
             # Specifications mentions LonePair twice as cdxml text value but 2 options in cdx
             return "LonePair"
         else:
-            val = str(CDXSymbolType(self.symbol_type))
-            return val.split('.')[1]  # only actually value without enum name
+            return self.name
 
 
 class CDXTagType(CDXType, Enum):
@@ -1904,8 +1872,6 @@ class CDXTagType(CDXType, Enum):
     Long = 2  # INT32
     String = 3  # unformatted string / byte sequence
 
-    TYPE_MAPPING = {"Unknown": "Unformatted", "Double": "FLOAT64", "Long": "INT32", "String": "Unformatted"}
-
     def __init__(self, value: int):
         self.tag_type = value
 
@@ -1924,8 +1890,12 @@ class CDXTagType(CDXType, Enum):
         return self.tag_type.to_bytes(2, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXTagType(self.tag_type))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
+
+
+# CDXType used for the "Value" property depending on the CDXTagType. Kept outside the enum as Enum would turn it into a
+# member.
+TAG_TYPE_MAPPING = {"Unknown": "Unformatted", "Double": "FLOAT64", "Long": "INT32", "String": "Unformatted"}
 
 
 class CDXValue(CDXType):
@@ -1980,8 +1950,6 @@ class CDXPositioningType(CDXType, Enum):
     absolute = 3
 
     def __init__(self, value: int):
-        if -1 > value > 3:
-            raise ValueError("Needs to be between 0 and 3")
         self.positioning_type = value
 
     @staticmethod
@@ -1999,8 +1967,7 @@ class CDXPositioningType(CDXType, Enum):
         return self.positioning_type.to_bytes(1, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXPositioningType(self.positioning_type))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXOvalType(CDXType):
@@ -2060,8 +2027,6 @@ class CDXOrbitalType(CDXType, Enum):
     dxyFilled = 520
 
     def __init__(self, value: int):
-        if 0 > value > 520:
-            raise ValueError("Needs to be between 0 and 520")
         self.orbital_type = value
 
     @staticmethod
@@ -2079,8 +2044,7 @@ class CDXOrbitalType(CDXType, Enum):
         return self.orbital_type.to_bytes(2, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXOrbitalType(self.orbital_type))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXRectangleType(CDXType):
@@ -2145,8 +2109,6 @@ class CDXPolymerRepeatPattern(CDXType, Enum):
     EitherUnknown = 2
 
     def __init__(self, value: int):
-        if 0 > value > 2:
-            raise ValueError("Needs to be between 0 and 2")
         self.repeat_pattern = value
 
     @staticmethod
@@ -2164,8 +2126,7 @@ class CDXPolymerRepeatPattern(CDXType, Enum):
         return self.repeat_pattern.to_bytes(2, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXPolymerRepeatPattern(self.repeat_pattern))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXPolymerFlipType(CDXType, Enum):
@@ -2174,8 +2135,6 @@ class CDXPolymerFlipType(CDXType, Enum):
     Flip = 2
 
     def __init__(self, value: int):
-        if 0 > value > 2:
-            raise ValueError("Needs to be between 0 and 2")
         self.flip_type = value
 
     @staticmethod
@@ -2193,8 +2152,7 @@ class CDXPolymerFlipType(CDXType, Enum):
         return self.flip_type.to_bytes(2, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXPolymerFlipType(self.flip_type))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXConstraintType(CDXType, Enum):
@@ -2204,8 +2162,6 @@ class CDXConstraintType(CDXType, Enum):
     ExclusionSphere = 3
 
     def __init__(self, value: int):
-        if 0 > value > 3:
-            raise ValueError("Needs to be between 0 and 3")
         self.constraint_type = value
 
     @staticmethod
@@ -2223,8 +2179,7 @@ class CDXConstraintType(CDXType, Enum):
         return self.constraint_type.to_bytes(2, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXConstraintType(self.constraint_type))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXLabelDisplay(CDXType, Enum):
@@ -2237,8 +2192,6 @@ class CDXLabelDisplay(CDXType, Enum):
     BestInitial = 6
 
     def __init__(self, value: int):
-        if 0 > value > 6:
-            raise ValueError("Needs to be between 0 and 6")
         self.label_display = value
 
     @staticmethod
@@ -2256,8 +2209,7 @@ class CDXLabelDisplay(CDXType, Enum):
         return self.label_display.to_bytes(1, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXLabelDisplay(self.label_display))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXExternalConnectionType(CDXType, Enum):
@@ -2276,8 +2228,6 @@ class CDXExternalConnectionType(CDXType, Enum):
     UnlinkedBranch = 12
 
     def __init__(self, value: int):
-        if 0 > value > 12:
-            raise ValueError("Needs to be between 0 and 12")
         self.connection_type = value
 
     @staticmethod
@@ -2295,8 +2245,7 @@ class CDXExternalConnectionType(CDXType, Enum):
         return self.connection_type.to_bytes(2, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXExternalConnectionType(self.connection_type))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXRxnParticipation(CDXType, Enum):
@@ -2310,8 +2259,6 @@ class CDXRxnParticipation(CDXType, Enum):
     Unmapped = 7
 
     def __init__(self, value: int):
-        if 0 > value > 7:
-            raise ValueError("Needs to be between 0 and 7")
         self.connection_type = value
 
     @staticmethod
@@ -2329,8 +2276,7 @@ class CDXRxnParticipation(CDXType, Enum):
         return self.connection_type.to_bytes(1, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXRxnParticipation(self.connection_type))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXRepresents(CDXType):
@@ -2349,8 +2295,8 @@ class CDXRepresents(CDXType):
     def from_element(represents: ET.Element) -> 'CDXRepresents':
         object_id = int(represents.attrib["object"])
         attribute = represents.attrib["attribute"]
-        tag_id = pycdxml.cdxml_converter.chemdraw_objects.ChemDrawDocument.PROPERTY_NAME_TO_TAG[attribute]
-        return CDXRepresents(object_id, tag_id.to_bytes(2, byteorder='little', signed=True))
+        doc = pycdxml.cdxml_converter.chemdraw_objects.ChemDrawDocument
+        return CDXRepresents(object_id, doc.PROPERTY_NAME_TO_TAG_BYTES[attribute])
 
     def to_bytes(self) -> bytes:
         stream = io.BytesIO()
@@ -2361,8 +2307,7 @@ class CDXRepresents(CDXType):
 
     def to_element(self) -> ET.Element:
         el = ET.Element('represent')
-        tag_id = int.from_bytes(self.attribute, "little", signed=True)
-        tag_name = pycdxml.cdxml_converter.chemdraw_objects.ChemDrawDocument.CDX_PROPERTIES[tag_id]["name"]
+        tag_name = pycdxml.cdxml_converter.chemdraw_objects.ChemDrawDocument.TAG_BYTES_TO_PROPERTY_NAME[self.attribute]
         el.attrib["attribute"] = tag_name
         return el
 
@@ -2378,30 +2323,24 @@ class CDXCurvePoints(CDXType):
 
     @staticmethod
     def from_bytes(property_bytes: bytes) -> 'CDXCurvePoints':
-        stream = io.BytesIO(property_bytes)
         # UINT16 that says how many CDXPoint2D follow
         # CDXPoint2D are two INT32 values
-        num_points = int.from_bytes(stream.read(2), "little", signed=False)
-        curve_points = []
-        for idx in range(num_points):
-            # y is stored before x in cdx
-            y = int.from_bytes(stream.read(4), "little", signed=True)
-            x = int.from_bytes(stream.read(4), "little", signed=True)
-            point = CDXPoint2D(CDXCoordinate(x), CDXCoordinate(y))
-            curve_points.append(point)
+        num_points = int.from_bytes(property_bytes[:2], "little", signed=False)
+        points_iter = struct.iter_unpack("<ii", property_bytes[2:2 + 8 * num_points])
+        # y is stored before x in cdx
+        curve_points = [CDXPoint2D(CDXCoordinate(x), CDXCoordinate(y)) for y, x in points_iter]
         return CDXCurvePoints(curve_points)
 
     @staticmethod
     def from_string(value: str) -> 'CDXCurvePoints':
-        converted_raw_values = [int(float(x) * CDXCoordinate.CDXML_CONVERSION_FACTOR) for x in value.split(" ")]
-        num_points = len(converted_raw_values) // 2
-        curve_points = []
-        for idx in range(num_points):
-            lst_idx = idx * 2
-            x = converted_raw_values[lst_idx]
-            y = converted_raw_values[lst_idx + 1]
-            point = CDXPoint2D(CDXCoordinate(x), CDXCoordinate(y))
-            curve_points.append(point)
+        raw_values = np.array(value.split(), dtype=np.float64)
+        if not np.isfinite(raw_values).all():
+            raise ValueError(f"CurvePoints must be finite numbers but got '{value}'.")
+        raw_values *= CDXCoordinate.CDXML_CONVERSION_FACTOR
+        num_points = len(raw_values) // 2
+        # astype truncates like int(), tolist() to get python ints back
+        converted = raw_values[:num_points * 2].astype(np.int64).reshape(-1, 2).tolist()
+        curve_points = [CDXPoint2D(CDXCoordinate(x), CDXCoordinate(y)) for x, y in converted]
         return CDXCurvePoints(curve_points)
 
     def to_bytes(self) -> bytes:
@@ -2434,16 +2373,14 @@ class CDXCompressed(CDXType):
 
     @staticmethod
     def from_string(value: str) -> 'CDXCompressed':
-        base64_bytes = value.encode('ascii')
-        data_bytes = base64.b64decode(base64_bytes)
-        return CDXCompressed(data_bytes)
+        # b64decode accepts ascii str directly
+        return CDXCompressed(base64.b64decode(value))
 
     def to_bytes(self) -> bytes:
         return self.data
 
     def to_property_value(self) -> str:
-        base64_bytes = base64.b64encode(self.data)
-        return base64_bytes.decode('ascii')
+        return base64.b64encode(self.data).decode('ascii')
 
 
 class CDXAngularSize(CDXType):
@@ -2475,8 +2412,6 @@ class CDXAtomRadical(CDXType, Enum):
     Triplet = 3
 
     def __init__(self, value: int):
-        if 0 > value > 3:
-            raise ValueError("Needs to be between 0 and 3")
         self.radical = value
 
     @staticmethod
@@ -2500,8 +2435,7 @@ class CDXAtomRadical(CDXType, Enum):
         if self.radical == 0:
             return "None"
         else:
-            val = str(CDXAtomRadical(self.radical))
-            return val.split('.')[1]  # only actually value without enum name
+            return self.name
 
 
 class CDXBioShapeType(CDXType, Enum):
@@ -2529,8 +2463,6 @@ class CDXBioShapeType(CDXType, Enum):
     RibosomeB = 21
 
     def __init__(self, value: int):
-        if 0 > value > 21:
-            raise ValueError("Needs to be between 0 and 21")
         self.bioshape_type = value
 
     @staticmethod
@@ -2543,7 +2475,7 @@ class CDXBioShapeType(CDXType, Enum):
     @staticmethod
     def from_string(value: str) -> 'CDXBioShapeType':
         if value[0].isdigit():
-            return CDXBioShapeType["_" + value]
+            return _BIO_SHAPE_TYPE_BY_DIGIT_NAME[value]
         else:
             return CDXBioShapeType[value]
 
@@ -2551,12 +2483,11 @@ class CDXBioShapeType(CDXType, Enum):
         return self.bioshape_type.to_bytes(2, byteorder='little', signed=False)
 
     def to_property_value(self) -> str:
-        if self.bioshape_type in [1, 2]:
-            val = str(CDXBioShapeType(self.bioshape_type))
-            return val.split('.')[1][1:]
-        else:
-            val = str(CDXBioShapeType(self.bioshape_type))
-            return val.split('.')[1]  # only actually value without enum name
+        # names of values 1 and 2 start with a digit and hence are prefixed with '_'
+        return self.name[1:] if self.bioshape_type in (1, 2) else self.name
+
+
+_BIO_SHAPE_TYPE_BY_DIGIT_NAME = {member.name[1:]: member for member in CDXBioShapeType if member.name[1].isdigit()}
 
 
 class CDXEnhancedStereoType(CDXType, Enum):
@@ -2567,8 +2498,6 @@ class CDXEnhancedStereoType(CDXType, Enum):
     And = 4
 
     def __init__(self, value: int):
-        if 0 > value > 4:
-            raise ValueError("Needs to be between 0 and 4")
         self.stereo_type = value
 
     @staticmethod
@@ -2592,8 +2521,7 @@ class CDXEnhancedStereoType(CDXType, Enum):
         if self.stereo_type == 1:
             return "None"
         else:
-            val = str(CDXEnhancedStereoType(self.stereo_type))
-            return val.split('.')[1]  # only actually value without enum name
+            return self.name
 
 
 class CDXDrawingSpace(CDXType, Enum):
@@ -2604,8 +2532,6 @@ class CDXDrawingSpace(CDXType, Enum):
     poster = 1
 
     def __init__(self, value: int):
-        if 0 > value > 7:
-            raise ValueError("Needs to be between 0 and 7")
         self.drawing_space = value
 
     @staticmethod
@@ -2623,8 +2549,7 @@ class CDXDrawingSpace(CDXType, Enum):
         return self.drawing_space.to_bytes(1, byteorder='little', signed=True)
 
     def to_property_value(self) -> str:
-        val = str(CDXDrawingSpace(self.drawing_space))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXConnectivity(CDXType, Enum):
@@ -2634,28 +2559,24 @@ class CDXConnectivity(CDXType, Enum):
     Staggered = 3
     Cyclic = 4
 
-    def __init__(self, value: int):
-        if 0 > value > 4:
-            raise ValueError("Needs to be between 0 and 4")
-        self.connectivity = value
-
     @staticmethod
     def from_bytes(property_bytes: bytes) -> 'CDXConnectivity':
-        if len(property_bytes) != 2:
+        if len(property_bytes) != _INT16.size:
             raise ValueError("CDXConnectivity should consist of 2 bytes.")
-        value = int.from_bytes(property_bytes, "little", signed=True)
+        value = _INT16.unpack(property_bytes)[0]
         return CDXConnectivity(value)
 
     @staticmethod
+    # only a handful of possible values which are parsed over and over again
+    @functools.lru_cache(maxsize=None)
     def from_string(value: str) -> 'CDXConnectivity':
         return CDXConnectivity[value]
 
     def to_bytes(self) -> bytes:
-        return self.connectivity.to_bytes(2, byteorder='little', signed=True)
+        return _INT16.pack(self.value)
 
     def to_property_value(self) -> str:
-        val = str(CDXConnectivity(self.connectivity))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXSequenceType(CDXType, Enum):
@@ -2668,28 +2589,23 @@ class CDXSequenceType(CDXType, Enum):
     RNA = 5
     Biopolymer = 6
 
-    def __init__(self, value: int):
-        if 0 > value > 6:
-            raise ValueError("Needs to be between 0 and 6")
-        self.sequence_type = value
-
     @staticmethod
     def from_bytes(property_bytes: bytes) -> 'CDXSequenceType':
-        if len(property_bytes) != 2:
+        if len(property_bytes) != _INT16.size:
             raise ValueError("CDXSequenceType should consist of 2 bytes.")
-        value = int.from_bytes(property_bytes, "little", signed=True)
+        value = _INT16.unpack(property_bytes)[0]
         return CDXSequenceType(value)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def from_string(value: str) -> 'CDXSequenceType':
         return CDXSequenceType[value]
 
     def to_bytes(self) -> bytes:
-        return self.sequence_type.to_bytes(2, byteorder='little', signed=True)
+        return _INT16.pack(self.value)
 
     def to_property_value(self) -> str:
-        val = str(CDXSequenceType(self.sequence_type))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXSideType(CDXType, Enum):
@@ -2700,30 +2616,25 @@ class CDXSideType(CDXType, Enum):
     Bottom = 3
     Right = 4
 
-    def __init__(self, value: int):
-        if 0 > value > 4:
-            raise ValueError("Needs to be between 0 and 4")
-        self.side_type = value
-
     @staticmethod
     def from_bytes(property_bytes: bytes) -> 'CDXSideType':
-        if len(property_bytes) != 2:
+        if len(property_bytes) != _INT16.size:
             raise ValueError("CDXSideType should consist of 2 bytes.")
-        value = int.from_bytes(property_bytes, "little", signed=True)
+        value = _INT16.unpack(property_bytes)[0]
         return CDXSideType(value)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def from_string(value: str) -> 'CDXSideType':
         # convert to title case eg left -> Left
         # This example above appear in a ChemDraw Sample file
         return CDXSideType[value.title()]
 
     def to_bytes(self) -> bytes:
-        return self.side_type.to_bytes(2, byteorder='little', signed=True)
+        return _INT16.pack(self.value)
 
     def to_property_value(self) -> str:
-        val = str(CDXSideType(self.side_type))
-        return val.split('.')[1]  # only actually value without enum name
+        return self.name
 
 
 class CDXPositioningAngle(CDXType):
@@ -2735,7 +2646,10 @@ class CDXPositioningAngle(CDXType):
 
     @staticmethod
     def from_bytes(property_bytes: bytes) -> 'CDXPositioningAngle':
-        value = int.from_bytes(property_bytes, "little", signed=True)
+        if len(property_bytes) == _INT32.size:
+            value = _INT32.unpack(property_bytes)[0]
+        else:
+            value = int.from_bytes(property_bytes, "little", signed=True)
         return CDXPositioningAngle(value)
 
     @staticmethod
@@ -2744,7 +2658,7 @@ class CDXPositioningAngle(CDXType):
         return CDXPositioningAngle(ang_size)
 
     def to_bytes(self) -> bytes:
-        return self.positioning_angle.to_bytes(4, byteorder='little', signed=True)
+        return _INT32.pack(self.positioning_angle)
 
     def to_property_value(self) -> str:
         return str(self.positioning_angle / CDXPositioningAngle.RADIANS_CONVERSION_FACTOR)
@@ -8,7 +8,8 @@ from ..utils import style
 from lxml import etree as ET
 from pathlib import Path
 import numpy as np
-import math
+import itertools
+import functools
 import logging
 
 logger = logging.getLogger('pycdxml.rdkit_chemdraw')
@@ -20,6 +21,53 @@ DEFAULT_ATOM_LABEL_FONT_SIZE = 10
 DEFAULT_ATOM_LABEL_FONT_COLOR = 0
 # Empirically determined value
 DEFAULT_AVG_BOND_LENGTH = 0.825
+# Use ACS 1996 as default style to build cdxml document. Read once and parsed per document.
+_TEMPLATE_BYTES = (Path(__file__).parent.parent / "cdxml_slide_generator" / "ACS 1996.cdxml").read_bytes()
+# attributes of the page element, the same for every document
+_DEFAULT_PAGE_PROPERTIES = {"BoundingBox": "0 0 540 719.75",
+                            "HeaderPosition": "36",
+                            "FooterPosition": "36",
+                            "PrintTrimMarks": "yes",
+                            "HeightPages": "1",
+                            "WidthPages": "1"
+                            }
+# cdxml values of the bonds 'BS' and 'Order' attributes
+_BOND_STEREO = {rdchem.BondStereo.STEREONONE: "N",
+                rdchem.BondStereo.STEREOANY: "U",
+                rdchem.BondStereo.STEREOCIS: "Z",
+                rdchem.BondStereo.STEREOZ: "Z",
+                rdchem.BondStereo.STEREOTRANS: "E",
+                rdchem.BondStereo.STEREOE: "E"
+                }
+# Single bonds are omitted as absence means single bond in ChemDraw and reduces file size.
+_BOND_ORDER = {rdchem.BondType.DOUBLE: "2",
+               rdchem.BondType.TRIPLE: "3",
+               rdchem.BondType.QUADRUPLE: "4",
+               rdchem.BondType.QUINTUPLE: "5",
+               rdchem.BondType.HEXTUPLE: "6",
+               rdchem.BondType.ONEANDAHALF: "1.5",
+               rdchem.BondType.AROMATIC: "1.5",
+               rdchem.BondType.TWOANDAHALF: "2.5",
+               rdchem.BondType.THREEANDAHALF: "3.5",
+               rdchem.BondType.FOURANDAHALF: "4.5",
+               rdchem.BondType.FIVEANDAHALF: "5.5",
+               rdchem.BondType.IONIC: "ionic",
+               rdchem.BondType.HYDROGEN: "hydrogen",
+               rdchem.BondType.THREECENTER: "threecenter",
+               # TODO: other dative types
+               rdchem.BondType.DATIVE: "dative"
+               }
+# Order of query bonds by their SMARTS
+_QUERY_BOND_ORDER = {"-,=": "1 2",  # single or double
+                     "": "1 1.5",  # single or aromatic
+                     "=,:": "2 1.5",  # double or aromatic
+                     "~": "any"  # any bond
+                     }
+# cdxml values of the atoms 'EnhancedStereoType' attribute
+_ENHANCED_STEREO_TYPE = {Chem.StereoGroupType.STEREO_ABSOLUTE: "Absolute",
+                         Chem.StereoGroupType.STEREO_AND: "And",
+                         Chem.StereoGroupType.STEREO_OR: "Or"
+                         }
 
 
 def mol_to_document(mol: Chem.Mol, chemdraw_style: dict = None, conformer_id: int = -1, margin=1,
@@ -41,12 +89,8 @@ def mol_to_document(mol: Chem.Mol, chemdraw_style: dict = None, conformer_id: in
     if mol is None:
         raise ValueError("Argument 'mol' is None. Expected valid RDKit molecule object.")
 
-    # Use ACS 1996 as default style to build cdxml document
-    # m_path = Path('C:/Users/kienerj/PycharmProjects/PyCDXML/pycdxml/cdxml_slide_generator')
-    m_path = Path(__file__).parent.parent
-    template_path = m_path / "cdxml_slide_generator" / "ACS 1996.cdxml"
-    cdxml = ET.parse(str(template_path))
-    root = cdxml.getroot()
+    root = ET.fromstring(_TEMPLATE_BYTES)
+    cdxml = ET.ElementTree(root)
 
     if chemdraw_style is not None:
         # if style is passed in, overwrite the attributes
@@ -57,54 +101,51 @@ def mol_to_document(mol: Chem.Mol, chemdraw_style: dict = None, conformer_id: in
         # Empty molfile -> return empty cdxml
         return ChemDrawDocument(cdxml)
 
-    object_id_sequence = iter(range(1, 10000))
-    page = ET.SubElement(root, "page")
-    page.attrib['id'] = str(next(object_id_sequence))
-    page.attrib.update(_get_default_page_properties())
+    # plain dict of the final document settings, avoids going through lxml for every lookup
+    root_attrs = dict(root.attrib)
+    object_id_sequence = itertools.count(1)
+    page = ET.SubElement(root, "page", id=str(next(object_id_sequence)))
+    page.attrib.update(_DEFAULT_PAGE_PROPERTIES)
 
     # For proper detection and setting of Wedge Bonds
     mol = Chem.Draw.rdMolDraw2D.PrepareMolForDrawing(mol, kekulize=True, addChiralHs=True, wedgeBonds=True)
 
     conformer = mol.GetConformer(conformer_id)
 
-    atom_coords = _get_coordinates(mol, conformer, float(root.attrib["BondLength"]), margin)
+    atom_coords = _get_coordinates(mol, conformer, float(root_attrs["BondLength"]), margin)
     min_coords = np.amin(atom_coords, axis=0)
     max_coords = np.amax(atom_coords, axis=0)
-    bb = str(min_coords[0]) + " " + str(min_coords[1]) + " " + str(max_coords[0]) + " " + str(max_coords[1])
-    props = {"BoundingBox": bb, "Z": "20"}
+    # formatting python floats is much faster than calling str() on numpy scalars
+    bb = " ".join(map(str, min_coords.tolist() + max_coords.tolist()))
+    props = {"id": str(next(object_id_sequence)), "BoundingBox": bb, "Z": "20"}
 
-    fragment = ET.SubElement(page, "fragment")
-    fragment.attrib['id'] = str(next(object_id_sequence))
-    fragment.attrib.update(props)
+    fragment = ET.SubElement(page, "fragment", props)
 
     # Advanced Stereo handling
     # remap based on ato, idx
     if include_enhanced_stereo:
-        adv_stereo_grps = mol.GetStereoGroups()
         adv_stereo_by_atom = {}
-        group_id = 1
-        for stereo_grp in adv_stereo_grps:
+        for group_number, stereo_grp in enumerate(mol.GetStereoGroups(), 1):
             stereo_type = stereo_grp.GetGroupType()
-            stereo_name = ''
-            if stereo_type == Chem.StereoGroupType.STEREO_ABSOLUTE:
-                stereo_name = 'Absolute'
-            elif stereo_type == Chem.StereoGroupType.STEREO_AND:
-                stereo_name = 'And'
-            elif stereo_type == Chem.StereoGroupType.STEREO_OR:
-                stereo_name = 'Or'
-            else:
+            if stereo_type not in _ENHANCED_STEREO_TYPE:
                 raise ValueError(f"Unknown StereoGroupType {stereo_type}.")
+            # (EnhancedStereoType, EnhancedStereoGroupNum) shared by all atoms of the group
+            group = (_ENHANCED_STEREO_TYPE[stereo_type], str(group_number))
             for atom in stereo_grp.GetAtoms():
-                atom_idx = atom.GetIdx()
-                adv_stereo_by_atom[atom_idx] = {"group_number": group_id, "group_type": stereo_name}
-            group_id = group_id + 1
+                adv_stereo_by_atom[atom.GetIdx()] = group
+
+    # same style for all atom labels, created once on the first labeled atom
+    label_style = None
 
-    atom_idx_id = {}
+    p_strings = [f"{x} {y}" for x, y in atom_coords.tolist()]
+    # id of each atom as string, indexed by atom index. Reused for the bonds begin and end attributes.
+    atom_ids = []
     for idx, atom in enumerate(mol.GetAtoms()):
         object_id = next(object_id_sequence)
-        atom_idx_id[idx] = object_id
-        p = str(atom_coords[idx][0]) + " " + str(atom_coords[idx][1])
-        props = {"p": p, "Z": str(20 + object_id), "Element": str(atom.GetAtomicNum())}
+        atom_id = str(object_id)
+        atom_ids.append(atom_id)
+        props = {"id": atom_id, "p": p_strings[idx], "Z": str(20 + object_id),
+                 "Element": str(atom.GetAtomicNum())}
 
         # hacky handling of Radicals and LonePairs
         # offset values empirically determined - likely to not work for different styles / font sizes
@@ -114,30 +155,24 @@ def mol_to_document(mol: Chem.Mol, chemdraw_style: dict = None, conformer_id: in
             offset_1 = 4.52
             offset_2 = 3.0
             props["Radical"] = "Doublet"
-            graphic = ET.SubElement(fragment, "graphic")
             bb_y = round(atom_coords[idx][1] - offset_1, 2)
-            graphic.attrib["BoundingBox"] = f"{round(atom_coords[idx][0] + offset_1, 2)} {bb_y} " \
-                                            f"{round(atom_coords[idx][0] - offset_2, 2)} {bb_y}"
-            graphic.attrib["id"] = str(next(object_id_sequence))
-            graphic.attrib["GraphicType"] = "Symbol"
-            graphic.attrib["SymbolType"] = "Electron"
-            represents = ET.SubElement(graphic, "represent")
-            represents.attrib["attribute"] = "Radical"
-            represents.attrib["object"] = str(object_id)
+            graphic_bb = f"{round(atom_coords[idx][0] + offset_1, 2)} {bb_y} " \
+                         f"{round(atom_coords[idx][0] - offset_2, 2)} {bb_y}"
+            graphic = ET.SubElement(fragment, "graphic", {"BoundingBox": graphic_bb,
+                                                         "id": str(next(object_id_sequence)),
+                                                         "GraphicType": "Symbol", "SymbolType": "Electron"})
+            ET.SubElement(graphic, "represent", {"attribute": "Radical", "object": atom_id})
         elif radical_electrons == 2:
             offset_1 = 1.87
             offset_2 = 7.87
             props["Radical"] = "Singlet"
-            graphic = ET.SubElement(fragment, "graphic")
             bb_y = round(atom_coords[idx][1] - offset_2, 2)
-            graphic.attrib["BoundingBox"] = f"{round(atom_coords[idx][0] + offset_1, 2)} {bb_y} " \
-                                            f"{round(atom_coords[idx][0] - offset_1, 2)} {bb_y}"
-            graphic.attrib["id"] = str(next(object_id_sequence))
-            graphic.attrib["GraphicType"] = "Symbol"
-            graphic.attrib["SymbolType"] = "LonePair"
-            represents = ET.SubElement(graphic, "represent")
-            represents.attrib["attribute"] = "Radical"
-            represents.attrib["object"] = str(object_id)
+            graphic_bb = f"{round(atom_coords[idx][0] + offset_1, 2)} {bb_y} " \
+                         f"{round(atom_coords[idx][0] - offset_1, 2)} {bb_y}"
+            graphic = ET.SubElement(fragment, "graphic", {"BoundingBox": graphic_bb,
+                                                         "id": str(next(object_id_sequence)),
+                                                         "GraphicType": "Symbol", "SymbolType": "LonePair"})
+            ET.SubElement(graphic, "represent", {"attribute": "Radical", "object": atom_id})
         elif radical_electrons == 3:
             # TODO: graphics for ChemDraw
             props["Radical"] = "Triplet"
@@ -153,10 +188,9 @@ def mol_to_document(mol: Chem.Mol, chemdraw_style: dict = None, conformer_id: in
 
         # Advanced Stereo
         if include_enhanced_stereo:
-            atom_idx = atom.GetIdx()
-            if atom_idx in adv_stereo_by_atom:
-                props["EnhancedStereoType"] = adv_stereo_by_atom[atom_idx]["group_type"]
-                props["EnhancedStereoGroupNum"] = str(adv_stereo_by_atom[atom_idx]["group_number"])
+            group = adv_stereo_by_atom.get(idx)
+            if group is not None:
+                props["EnhancedStereoType"], props["EnhancedStereoGroupNum"] = group
 
         formal_charge = atom.GetFormalCharge()
         if formal_charge != 0:
@@ -165,129 +199,52 @@ def mol_to_document(mol: Chem.Mol, chemdraw_style: dict = None, conformer_id: in
         if atom.GetIsotope() != 0:
             props["Isotope"] = str(atom.GetIsotope())
 
-        atom_obj = ET.SubElement(fragment, "n")
-        atom_obj.attrib['id'] = str(object_id)
-        atom_obj.attrib.update(props)
+        atom_obj = ET.SubElement(fragment, "n", props)
 
         # text label for Heteroatoms or charged carbons
         if atom.GetAtomicNum() != 6 or formal_charge != 0 or radical_electrons > 0:
             total_hs = atom.GetTotalNumHs()
             atom_obj.attrib["NumHydrogens"] = str(total_hs)
-            lbl = atom.GetSymbol()
-            # Deuterium
-            if lbl == "H" and atom.GetIsotope() == 2:
-                lbl = "D"
-            if total_hs > 0:
-                lbl += "H"
-                if total_hs > 1:
-                    lbl += str(total_hs)
-
-            if formal_charge > 0:
-                if formal_charge == 1:
-                    lbl += "+"
-                else:
-                    lbl += "+" + str(formal_charge)
-            elif formal_charge < 0:
-                if formal_charge == -1:
-                    lbl += "-"
-                else:
-                    # charge already contains minus symbol no need to add
-                    lbl += str(formal_charge)
-
-            cdx_style = CDXFontStyle(int(root.attrib.get('LabelFont', DEFAULT_ATOM_LABEL_FONT_ID)),
-                                     int(root.attrib.get('LabelFace', DEFAULT_ATOM_LABEL_FONT_FACE)),
-                                     # Font Size in cdx is 1/20ths of a point
-                                     int(float(root.attrib.get('LabelSize', DEFAULT_ATOM_LABEL_FONT_SIZE)) * 20),
-                                     DEFAULT_ATOM_LABEL_FONT_COLOR)
-
-            cdx_string = CDXString(lbl, style_starts=[0], styles=[cdx_style])
-
-            atm_lbl = ET.SubElement(atom_obj, "t")
-            atm_lbl.attrib['id'] = str(next(object_id_sequence))
+            lbl = _atom_label(atom.GetSymbol(), atom.GetIsotope(), total_hs, formal_charge)
+
+            if label_style is None:
+                label_style = CDXFontStyle(int(root_attrs.get('LabelFont', DEFAULT_ATOM_LABEL_FONT_ID)),
+                                           int(root_attrs.get('LabelFace', DEFAULT_ATOM_LABEL_FONT_FACE)),
+                                           # Font Size in cdx is 1/20ths of a point
+                                           int(float(root_attrs.get('LabelSize', DEFAULT_ATOM_LABEL_FONT_SIZE)) * 20),
+                                           DEFAULT_ATOM_LABEL_FONT_COLOR)
+            cdx_string = CDXString(lbl, style_starts=[0], styles=[label_style])
+
+            atm_lbl = ET.SubElement(atom_obj, "t", id=str(next(object_id_sequence)))
             atm_lbl = cdx_string.to_element(atm_lbl)
             atom_obj.append(atm_lbl)
 
     bonds = {}
     for bond in mol.GetBonds():
         object_id = next(object_id_sequence)
-        begin_atom_id = atom_idx_id[bond.GetBeginAtomIdx()]
-        end_atom_id = atom_idx_id[bond.GetEndAtomIdx()]
-        props = {"Z": str(20 + object_id), "B": str(begin_atom_id), "E": str(end_atom_id)}
+        props = {"id": str(object_id), "Z": str(20 + object_id), "B": atom_ids[bond.GetBeginAtomIdx()],
+                 "E": atom_ids[bond.GetEndAtomIdx()]}
 
         bond_type = bond.GetBondType()
         bond_stereo = bond.GetStereo()
         bond_direction = bond.GetBondDir()
 
-        if bond_stereo == rdchem.BondStereo.STEREONONE:
+        if bond_stereo == rdchem.BondStereo.STEREOANY and bond_type == rdchem.BondType.DOUBLE and crossed_bonds:
+            # this means crossed double bond aka wavy bond which in chemdraw must be created as below
             props["BS"] = "N"
-        elif bond_stereo == rdchem.BondStereo.STEREOANY:
-            if bond_type == rdchem.BondType.DOUBLE and crossed_bonds:
-                # this means crossed double bond aka wavy bond which in chemdraw must be created as below
-                props["BS"] = "N"
-                props["Display"] = "Wavy"
-            else:
-                props["BS"] = "U"
-        elif bond_stereo == rdchem.BondStereo.STEREOCIS:
-            props["BS"] = "Z"
-        elif bond_stereo == rdchem.BondStereo.STEREOZ:
-            props["BS"] = "Z"
-        elif bond_stereo == rdchem.BondStereo.STEREOTRANS:
-            props["BS"] = "E"
-        elif bond_stereo == rdchem.BondStereo.STEREOE:
-            props["BS"] = "E"
-
-        # if bond_type == rdchem.BondType.SINGLE:
-        # props["Order"] = "1"
-        # Do nothing as absence means single bond in ChemDraw and reduces file size.
-        if bond_type == rdchem.BondType.DOUBLE:
-            props["Order"] = "2"
-        elif bond_type == rdchem.BondType.TRIPLE:
-            props["Order"] = "3"
-        elif bond_type == rdchem.BondType.QUADRUPLE:
-            props["Order"] = "4"
-        elif bond_type == rdchem.BondType.QUINTUPLE:
-            props["Order"] = "5"
-        elif bond_type == rdchem.BondType.HEXTUPLE:
-            props["Order"] = "6"
-        elif bond_type == rdchem.BondType.ONEANDAHALF:
-            props["Order"] = "1.5"
-        elif bond_type == rdchem.BondType.AROMATIC:
-            props["Order"] = "1.5"
-        elif bond_type == rdchem.BondType.TWOANDAHALF:
-            props["Order"] = "2.5"
-        elif bond_type == rdchem.BondType.THREEANDAHALF:
-            props["Order"] = "3.5"
-        elif bond_type == rdchem.BondType.FOURANDAHALF:
-            props["Order"] = "4.5"
-        elif bond_type == rdchem.BondType.FIVEANDAHALF:
-            props["Order"] = "5.5"
-        elif bond_type == rdchem.BondType.IONIC:
-            props["Order"] = "ionic"
-        elif bond_type == rdchem.BondType.HYDROGEN:
-            props["Order"] = "hydrogen"
-        elif bond_type == rdchem.BondType.THREECENTER:
-            props["Order"] = "threecenter"
-        elif bond_type == rdchem.BondType.DATIVE:
-            props["Order"] = "dative"
-            # TODO: other dative types
+            props["Display"] = "Wavy"
+        elif bond_stereo in _BOND_STEREO:
+            props["BS"] = _BOND_STEREO[bond_stereo]
+
+        if bond_type in _BOND_ORDER:
+            props["Order"] = _BOND_ORDER[bond_type]
         elif bond_type == rdchem.BondType.UNSPECIFIED and bond.HasQuery():
             qry_smarts = bond.GetSmarts()
-            if qry_smarts == "-,=":
-                # single or double
-                props["Order"] ="1 2"
-            elif not qry_smarts:
-                # single or aromatic
-                props["Order"] = "1 1.5"
-            elif qry_smarts == "=,:":
-                # single or double
-                props["Order"] ="2 1.5"
-            elif qry_smarts == "~":
-                # Any bond
-                props["Order"] ="any"
+            if qry_smarts in _QUERY_BOND_ORDER:
+                props["Order"] = _QUERY_BOND_ORDER[qry_smarts]
             else:
                 raise ValueError(f"Molecule contains unsupported bond query {qry_smarts}.")
 
-
         # Bond Display
         if bond_direction == rdchem.BondDir.BEGINDASH:
             props["Display"] = "WedgedHashBegin"
@@ -299,14 +256,40 @@ def mol_to_document(mol: Chem.Mol, chemdraw_style: dict = None, conformer_id: in
         if bond.HasProp("_CDXDisplay"):
             props["Display"] = bond.GetProp("_CDXDisplay")
 
-        bond_obj = ET.SubElement(fragment, "b")
-        bond_obj.attrib['id'] = str(object_id)
-        bond_obj.attrib.update(props)
+        bond_obj = ET.SubElement(fragment, "b", props)
         bonds[bond.GetIdx()] = bond_obj
 
     return ChemDrawDocument(cdxml)
 
 
+@functools.lru_cache(maxsize=256)
+def _atom_label(symbol: str, isotope: int, total_hs: int, formal_charge: int) -> str:
+    """
+    Builds the text of an atom label, eg. NH2 or O-. Cached as the same few labels occur over and over again.
+    """
+    lbl = symbol
+    # Deuterium
+    if lbl == "H" and isotope == 2:
+        lbl = "D"
+    if total_hs > 0:
+        lbl += "H"
+        if total_hs > 1:
+            lbl += str(total_hs)
+
+    if formal_charge > 0:
+        if formal_charge == 1:
+            lbl += "+"
+        else:
+            lbl += "+" + str(formal_charge)
+    elif formal_charge < 0:
+        if formal_charge == -1:
+            lbl += "-"
+        else:
+            # charge already contains minus symbol no need to add
+            lbl += str(formal_charge)
+    return lbl
+
+
 def _set_end_wedge_display_style(bonds: dict, wedge_bond: rdchem.Bond, display: str):
     """
     RDKit only defines start of wedge bond. In ChemDraw if the end of the wedge is connected to another bond said other
@@ -328,17 +311,6 @@ def _set_end_wedge_display_style(bonds: dict, wedge_bond: rdchem.Bond, display:
                 b.SetProp("_CDXDisplay", display)
 
 
-def _get_default_page_properties():
-    props = {"BoundingBox": "0 0 540 719.75",
-             "HeaderPosition": "36",
-             "FooterPosition": "36",
-             "PrintTrimMarks": "yes",
-             "HeightPages": "1",
-             "WidthPages": "1"
-             }
-    return props
-
-
 def _get_coordinates(mol: Chem.Mol, conformer: Chem.Conformer, bond_length: float, margin: float):
     """
     Assume coordinates are already in points (not true) but it works. Then we simply determine the current bond length
@@ -361,25 +333,22 @@ def _get_coordinates(mol: Chem.Mol, conformer: Chem.Conformer, bond_length: floa
         rdCoordGen.AddCoords(mol)
         mol.UpdatePropertyCache()
         conformer = mol.GetConformer()
+        coords = conformer.GetPositions()
     elif mean_coords[0] == 0 and mean_coords[1] == 0:
         # no coordinates assigned! generate them
         rdCoordGen.AddCoords(mol)
         mol.UpdatePropertyCache()
         conformer = mol.GetConformer()
+        coords = conformer.GetPositions()
 
     bonds = mol.GetBonds()
 
     if len(bonds) > 0:
-        total = 0
-        for bond in bonds:
-
-            ai = bond.GetBeginAtomIdx()
-            aj = bond.GetEndAtomIdx()
-            bl = AllChem.GetBondLength(conformer, ai, aj)
-            if not math.isnan(bl):
-                total += bl
-
-        avg_bl = (total / len(bonds))
+        begin_idx = np.fromiter((bond.GetBeginAtomIdx() for bond in bonds), dtype=np.intp, count=len(bonds))
+        end_idx = np.fromiter((bond.GetEndAtomIdx() for bond in bonds), dtype=np.intp, count=len(bonds))
+        bond_lengths = np.linalg.norm(coords[begin_idx] - coords[end_idx], axis=1)
+        # bonds with invalid length are ignored but still count towards the number of bonds
+        avg_bl = np.nansum(bond_lengths) / len(bonds)
     else:
         # Molecules like simple salt (NaCl) with zero bonds
         # Use a default bond length / scaling
@@ -389,19 +358,15 @@ def _get_coordinates(mol: Chem.Mol, conformer: Chem.Conformer, bond_length: floa
     if avg_bl > 0.0:
         # scale
         bl_ratio = bond_length / avg_bl
-        coords = conformer.GetPositions()
-        c_scaled = coords * bl_ratio
-        # make 2 D
-        c_scaled = np.delete(c_scaled, 2, 1)
+        # scale and make 2D in one step
         # flip vertically - coordinates form rdkit/molfile have negative y when going "down" in terms of the screen
         # In ChemDraw the further down, the higher the y coordinate with origin in top-left (only y coordinate flipped)
-        c_scaled = c_scaled * [[1,-1]]
-        # transform
+        c_scaled = coords[:, :2] * np.array([bl_ratio, -bl_ratio])
+        # transform so that the molecule starts at the margin from the top-left corner
+        margin_pts = margin * CM_TO_POINTS
         cmin = np.amin(c_scaled, axis=0)
-        tx = margin * CM_TO_POINTS - cmin[0]
-        ty = margin * CM_TO_POINTS - cmin[1]
-        t = np.array([tx, ty])
-        coords_trans = c_scaled + t
-        return np.around(coords_trans, decimals=2)
+        t = margin_pts - cmin
+        np.add(c_scaled, t, out=c_scaled)
+        return np.around(c_scaled, decimals=2, out=c_scaled)
     else:
         raise ValueError("Average Bond Length is 0 or negative.")
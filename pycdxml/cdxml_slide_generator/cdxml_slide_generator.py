@@ -1,6 +1,7 @@
 from lxml import etree as ET
 import numpy as np
 import math
+import copy
 from pathlib import Path
 from ..cdxml_styler import CDXMLStyler
 from ..utils import cdxml_io
@@ -11,13 +12,21 @@ from ..utils.font_handling import *
 
 class CDXMLSlideGenerator(object):
 
+    # parsed style templates by style name. Parsed once, every new slide works on a copy
+    _TEMPLATE_CACHE = {}
+    # maximum number of styled input documents kept per generator
+    _STYLED_DOCUMENTS_MAX_SIZE = 256
+
     def __init__(self, columns=7, rows=3, font_size=10, font="Arial", number_of_properties=4, slide_width=30.4,
                  slide_height=13, style="ACS 1996"):
 
         self.style_name = "ACS 1996"
         self.font_size = font_size
         self.font = font
+        # only used to estimate the space atom labels need, a similar default font is good enough if it's missing
         self.tt_font = get_font_by_name(self.font)
+        # label text widths by text. Font and font size are fixed so the few distinct labels only need measuring once
+        self._text_widths = {}
         self.columns = columns
         self.rows = rows
         self.mols_per_slide = columns * rows
@@ -35,9 +44,15 @@ class CDXMLSlideGenerator(object):
         self.molecule_width = self.column_width - self.margin
         self.colortable = {}
         self.style = style
+        # reused for all input documents. blank text only inflates the tree that is iterated over. It doesn't change the
+        # slide as all whitespace between elements is replaced anyway when the slide is indented on output
+        self._parser = ET.XMLParser(remove_blank_text=True)
         self.slide, self.font_table = self._build_base_document(style)
         style_dict = self.slide.attrib
         self.styler = CDXMLStyler(style_dict=style_dict)
+        # styled documents by input cdxml. The same structure is often shown many times (duplicates, series) and
+        # copying the styled tree is much cheaper than parsing and styling it again
+        self._styled_documents = {}
 
     def generate_slides(self, cdxml_documents, properties) -> list:
         """
@@ -83,18 +98,23 @@ class CDXMLSlideGenerator(object):
         self.slide, self.font_table = self._build_base_document(self.style)
         self.colortable = {}
 
+        if self.number_of_properties > 0 and len(cdxml_documents) > 0:
+            # register font and colors of all displayed properties once, in the order they appear on the slide
+            font_id = str(self.font_table.add_font(self.font))
+            font_size = str(self.font_size)
+            color_ids = [[str(self.register_color(prop.color)) for prop in props[:self.number_of_properties]]
+                         for props in properties]
+
         for index, cdxml in enumerate(cdxml_documents):
-            cdxml = self.styler.apply_style_to_string(cdxml)
-            root = ET.fromstring(bytes(cdxml, encoding="utf8"))
+            # the cached tree is shared so work on a copy as the fragments are moved into the slide
+            root = copy.deepcopy(self._get_styled_document(cdxml))
+            # determine grid position
+            row, column = divmod(index, self.columns)
 
-            grp = self._build_group_element(root, index)
+            grp = self._build_group_element(root, row, column)
 
             # handle properties
             if self.number_of_properties > 0:
-                # determine grid position
-                row = index // self.columns
-                column = index % self.columns
-
                 props = properties[index][:self.number_of_properties]
                 y_top = row * self.row_height + self.molecule_height + self.margin
                 y_bottom = y_top + self.text_height
@@ -102,42 +122,35 @@ class CDXMLSlideGenerator(object):
                 x_left = column * self.column_width + self.margin
                 x_right = (column + 1) * self.column_width - self.margin
 
-                txt = ET.Element("t")
-                txt.attrib["LineHeight"] = str(self.line_height)
-                txt.attrib["id"] = str(5000 + index)
-                txt.attrib["BoundingBox"] = f"{x_left} {y_top} {x_right} {y_bottom}"
                 # TODO: proper position calculation
                 # with Arial font 10 the y-coord of p of a t element is 8.95 points higher than the bounding box top edge
                 # For Arial this "margin seems to be 89.5 % if the font size
                 # But it's different for other fonts
-                txt.attrib["p"] = f"{x_left} {y_top + 0.895 * self.font_size}"
+                txt = ET.Element("t", {"LineHeight": str(self.line_height),
+                                       "id": str(5000 + index),
+                                       "BoundingBox": f"{x_left} {y_top} {x_right} {y_bottom}",
+                                       "p": f"{x_left} {y_top + 0.895 * self.font_size}"})
                 line_starts = []
                 text_length = 0
-                font_id = self.font_table.add_font(self.font)
-
-                for prop_index, prop in enumerate(props):
-                    s = ET.SubElement(txt, "s")
-                    s.attrib["font"] = str(font_id)
-                    s.attrib["color"] = str(self.register_color(prop.color))
-                    s.attrib["size"] = str(self.font_size)
-
-                    if prop_index + 1 == self.number_of_properties:
-                        s.text = prop.get_display_value()
-                    else:
-                        s.text = prop.get_display_value() + "\n"
-                    text_length += len(s.text)
+
+                for prop_index, (prop, color_id) in enumerate(zip(props, color_ids[index])):
+                    s = ET.SubElement(txt, "s", {"font": font_id, "color": color_id, "size": font_size})
+
+                    text = prop.get_display_value()
+                    if prop_index + 1 != self.number_of_properties:
+                        text += "\n"
+                    s.text = text
+                    text_length += len(text)
                     line_starts.append(str(text_length))
 
                     # Add properties as annotations so that they are exported to sdf!
-                    annotation = ET.SubElement(grp, "annotation")
-                    annotation.attrib["Keyword"] = prop.name
-                    annotation.attrib["Content"] = str(prop.value)
+                    ET.SubElement(grp, "annotation", {"Keyword": prop.name, "Content": str(prop.value)})
 
                 txt.attrib["LineStarts"] = " ".join(line_starts)
                 #self.slide.find('page').append(txt)
                 grp.append(txt)
 
-            self.slide.find("page").append(grp)
+            self._page.append(grp)
 
         return cdxml_io.etree_to_cdxml(self.slide)
 
@@ -174,7 +187,20 @@ class CDXMLSlideGenerator(object):
 
         return doc
 
-    def _build_group_element(self, cdxml_root, document_idx: int):
+    def _get_styled_document(self, cdxml: str) -> ET.Element:
+        """
+        Returns the styled tree of the cdxml document. The tree is cached and hence must not be modified.
+        """
+        root = self._styled_documents.get(cdxml)
+        if root is None:
+            if len(self._styled_documents) >= self._STYLED_DOCUMENTS_MAX_SIZE:
+                # remove the oldest document
+                del self._styled_documents[next(iter(self._styled_documents))]
+            root = self.styler.apply_style_to_element(ET.fromstring(cdxml.encode("utf-8"), self._parser))
+            self._styled_documents[cdxml] = root
+        return root
+
+    def _build_group_element(self, cdxml_root, row: int, column: int):
         """
         Build a new group element that contains all the fragments in this document.
 
@@ -182,40 +208,30 @@ class CDXMLSlideGenerator(object):
         corner. Then it is scaled to fit into the grid including all fragments.
         """
 
-        fragments = cdxml_root.findall(".//fragment")
-
-        # determine grid position
-        row = document_idx // self.columns
-        column = document_idx % self.columns
+        # collect fragments and the nodes with labels (usually hetero atoms) in a single pass
+        fragments = []
+        label_nodes = []
+        for element in cdxml_root.iter("fragment", "n"):
+            if element.tag == "fragment":
+                fragments.append(element)
+            elif element.find("t") is not None:
+                label_nodes.append(element)
 
         if len(fragments) == 0:
             # return an empty group element
-            grp = ET.Element("group")
-            grp.attrib["BoundingBox"] = f"0 0 {self.molecule_width} {self.molecule_height}"
+            grp = ET.Element("group", BoundingBox=f"0 0 {self.molecule_width} {self.molecule_height}")
             x_translate, y_translate = self._get_translation_to_grid_position(grp, row, column)
             geometry.fix_bounding_box(grp, x_translate, y_translate)
             return grp
 
         # determine "minimum" bound box for all fragments
-        min_left = 10000
-        min_top = 10000
-        max_right = 0
-        max_bottom = 0
-
-        for fragment in fragments:
-            bb = fragment.attrib["BoundingBox"]
-            bounding_box = [float(x) for x in bb.split(" ")]
-            if bounding_box[0] < min_left:
-                min_left = bounding_box[0]
-            if bounding_box[1] < min_top:
-                min_top = bounding_box[1]
-            if bounding_box[2] > max_right:
-                max_right = bounding_box[2]
-            if bounding_box[3] > max_bottom:
-                max_bottom = bounding_box[3]
+        bounding_boxes = np.asarray([[float(x) for x in fragment.attrib["BoundingBox"].split(" ")]
+                                     for fragment in fragments])
+        min_left, min_top = np.amin(bounding_boxes[:, :2], axis=0, initial=10000).tolist()
+        max_right, max_bottom = np.amax(bounding_boxes[:, 2:4], axis=0, initial=0).tolist()
 
         # calculate additional margin for atom labels not part of above bounding box
-        label_margins = self._get_label_margins(cdxml_root, min_left, min_top, max_right, max_bottom)
+        label_margins = self._get_label_margins(label_nodes, min_left, min_top, max_right, max_bottom)
         min_left = min_left - label_margins[0]
         min_top = min_top - label_margins[1]
         max_right = max_right + label_margins[2]
@@ -228,19 +244,16 @@ class CDXMLSlideGenerator(object):
         height_factor = self.molecule_height / height
         scaling_factor = min([width_factor, height_factor])
 
-        grp = ET.Element("group")
-        grp.attrib["BoundingBox"] = f"{min_left} {min_top} {max_right} {max_bottom}"
-        annotation = ET.SubElement(grp, "annotation")
-        annotation.attrib["Keyword"] = "Scaling Factor"
+        grp = ET.Element("group", BoundingBox=f"{min_left} {min_top} {max_right} {max_bottom}")
+        annotation = ET.SubElement(grp, "annotation", Keyword="Scaling Factor")
 
         if scaling_factor < 1:
             annotation.attrib["Content"] = str(1 / scaling_factor * 100)
 
-            # Scale bounding box of new group element
-            coords = np.asarray([[min_left, min_top], [max_right, max_bottom]])
-            grp_center = geometry.get_element_center(grp)
-            bb_scaled = coords * scaling_factor
-            x_translate, y_translate = geometry.get_translation(coords, bb_scaled)
+            # Scale bounding box of new group element around its center
+            grp_center = ((min_left + max_right) / 2, (min_top + max_bottom) / 2)
+            x_translate = grp_center[0] - (min_left * scaling_factor + max_right * scaling_factor) / 2
+            y_translate = grp_center[1] - (min_top * scaling_factor + max_bottom * scaling_factor) / 2
             geometry.fix_bounding_box(grp, x_translate, y_translate, scaling_factor)
 
             # Translate group element to final position
@@ -248,20 +261,16 @@ class CDXMLSlideGenerator(object):
             geometry.fix_bounding_box(grp, x_translate, y_translate)
             grp_center_final = geometry.get_element_center(grp)
 
-            for fragment in fragments:
+            # centers of the unscaled fragments from the already parsed bounding boxes
+            frg_centers = (bounding_boxes[:, :2] + bounding_boxes[:, 2:4]) / 2
+            for fragment, frg_center in zip(fragments, frg_centers):
                 # Final position of fragment is calculated using the distance from the groups center
                 # 1. Get distance vector between fragment center and group center unscaled
                 # 2. Multiply above vector with scaling factor
                 # 3. Scale the fragment
-                # 4. Determine distance vector of scaled fragment center from scaled group center
-                # 5. Translate fragment by that amount so distance from center remains proportional
-                frg_center = geometry.get_element_center(fragment)
+                # 4. Translate fragment so that its center is at that distance from the final group center
                 center_distance = np.array(geometry.get_translation_vector(frg_center, grp_center)) * scaling_factor
-                self._scale_fragment(fragment, scaling_factor)
-                frg_center_scaled = geometry.get_element_center(fragment)
-                x_translate = (grp_center_final[0] + center_distance[0]) - frg_center_scaled[0]
-                y_translate = (grp_center_final[1] + center_distance[1]) - frg_center_scaled[1]
-                self._translate_fragment(fragment, x_translate, y_translate)
+                self._scale_and_translate_fragment(fragment, scaling_factor, grp_center_final + center_distance)
                 grp.append(fragment)
 
         else:
@@ -276,45 +285,53 @@ class CDXMLSlideGenerator(object):
 
         return grp
 
-    def _get_label_margins(self, cdxml_root: ET.Element, min_left: float, min_top: float, max_right: float,
+    def _get_label_margins(self, nodes: list, min_left: float, min_top: float, max_right: float,
                            max_bottom: float):
 
         # Only nodes with contained text (usually hetero atoms) are relevant
-        nodes = cdxml_root.findall(".//n[t]")
         # left, top, right, bottom
         label_margins = [0, 0, 0, 0]
         for node in nodes:
             p = [float(x) for x in node.attrib["p"].split(" ")]
-            s = node.find("t").find("s")
-            text_width = get_text_width(s.text, self.tt_font, self.font_size)
             # for left and right, a node not at the outer edge can still have text outside the bounding box
             # this text needs to be part of the margin
             # Ideally bond direction is known so text direction could be determined
-            # Edge-cases with long labels might still get cut-off labels if abs_tol is too small
-            if math.isclose(p[0], min_left,  abs_tol=self.font_size):
-                most_left = p[0] - text_width
+            # Edge-cases with long labels might still get cut-off labels if the tolerance is too small
+            # text width is only measured for nodes at the left or right edge
+            if abs(p[0] - min_left) <= self.font_size:
+                most_left = p[0] - self._get_label_width(node)
                 margin = p[0] - most_left
                 if most_left < p[0] and margin > label_margins[0]:
                     label_margins[0] = margin
-            elif math.isclose(p[0], max_right,  abs_tol=self.font_size):
-                most_right= p[0] + text_width
+            elif abs(p[0] - max_right) <= self.font_size:
+                most_right= p[0] + self._get_label_width(node)
                 margin = most_right - p[0]
                 if most_right < p[0] and margin > label_margins[2]:
                     label_margins[2] = margin
             # Top/Bottom is 1 line always, doesn't depend on text length
-            elif math.isclose(p[1], min_top, abs_tol=5):
+            elif abs(p[1] - min_top) <= 5:
                 label_margins[1] = self.font_size
-            elif math.isclose(p[1], max_bottom, abs_tol=5):
+            elif abs(p[1] - max_bottom) <= 5:
                 label_margins[3] = self.font_size
 
         return label_margins
 
+    def _get_label_width(self, node: ET.Element) -> float:
+
+        text = node.find("t").find("s").text
+        text_width = self._text_widths.get(text)
+        if text_width is None:
+            text_width = get_text_width(text, self.tt_font, self.font_size)
+            self._text_widths[text] = text_width
+        return text_width
+
     def _get_translation_to_grid_position(self, element: ET.Element, row: int, column: int):
         """
         Get x and y translation amount for moving the element into the desired grid position.
         The element will be centered vertically and left-aligned.
         """
-        bounding_box = np.asarray([float(x) for x in element.attrib["BoundingBox"].split(" ")])
+        # plain floats, a numpy array for 4 values is only overhead
+        bounding_box = [float(x) for x in element.attrib["BoundingBox"].split(" ")]
         # grid_center_x = (column + 0.5) * self.column_width
         grid_center_y = row * self.row_height + 0.5 * self.molecule_height + 0.5*self.margin
         # current_x_center = (fragment_bb[0] + fragment_bb[2]) / 2
@@ -326,38 +343,48 @@ class CDXMLSlideGenerator(object):
 
         return x_translate, y_translate
 
-    def _scale_fragment(self, fragment: ET.Element, scaling_factor):
-
+    def _scale_and_translate_fragment(self, fragment: ET.Element, scaling_factor, destination_center: np.ndarray):
+        """
+        Scales the fragment around its center and then moves it so that its center is at destination_center.
+        The node coordinates are only read from and written to the fragment once.
+        """
         all_coords, node_id_mapping, bonds, label_coords = self.styler.get_coords_and_mapping(fragment)
         scaled_coords = all_coords * scaling_factor
 
         x_translate, y_translate = geometry.get_translation(all_coords, scaled_coords)
-        final_coords = geometry.translate(scaled_coords, x_translate, y_translate)
+        # translate in place, the scaled coordinates aren't needed anymore
+        scaled_coords += (x_translate, y_translate)
         geometry.fix_bounding_box(fragment, x_translate, y_translate, scaling_factor)
 
-        self._translate_nodes(fragment, final_coords, scaling_factor)
+        # center of the scaled fragment is determined from its (rounded) bounding box
+        x_translate, y_translate = destination_center - geometry.get_element_center(fragment)
+        scaled_coords += (x_translate, y_translate)
+        geometry.fix_bounding_box(fragment, x_translate, y_translate)
+
+        self._translate_nodes(fragment, scaled_coords, scaling_factor)
 
     def _translate_fragment(self, fragment: ET.Element, x_translate: float, y_translate: float):
 
-        all_coords, node_id_mapping, bonds, label_coords = self.styler.get_coords_and_mapping(fragment)
-        final_coords = geometry.translate(all_coords, x_translate, y_translate)
+        # only an addition per node, cheaper with python floats than building a numpy array
+        x_translate = float(x_translate)
+        y_translate = float(y_translate)
+        for node in fragment.iter("n"):
+            x, y = node.attrib["p"].split(" ")
+            node.attrib["p"] = f"{float(x) + x_translate} {float(y) + y_translate}"
         geometry.fix_bounding_box(fragment, x_translate, y_translate)
 
-        self._translate_nodes(fragment, final_coords)
-
     def _translate_nodes(self, fragment: ET.Element, destination_coordinates, scaling_factor=None):
 
-        idx = 0
-        for node in fragment.iter("n"):
-            coords_xml = str(destination_coordinates[idx][0]) + " " + str(destination_coordinates[idx][1])
-            node.attrib["p"] = coords_xml
-            idx += 1
+        # formatting python floats is much faster than calling str() on numpy scalars
+        for node, (x, y) in zip(fragment.iter("n"), destination_coordinates.tolist()):
+            node.attrib["p"] = f"{x} {y}"
         if scaling_factor is not None:
-            # scale all text
+            # scale all text, all labels get the same size
+            label_size = str(round(float(self.styler.style["LabelSize"]) * scaling_factor, 2))
             for t in fragment.iter("t"):
                 for s in t.iter("s"):
                     # scales Atom Labels
-                    s.attrib["size"] = str(round(float(self.styler.style["LabelSize"]) * scaling_factor, 2))
+                    s.attrib["size"] = label_size
             # TODO: scaling for graphics and other elements like arrows, curves...
 
     def _build_base_document(self, style):
@@ -368,12 +395,17 @@ class CDXMLSlideGenerator(object):
               '"\n></page>']
         page = "".join(sb)
 
-        template_name = style + ".cdxml"
-        module_path = Path(__file__).parent
-        template_path = module_path / template_name
-        tree = ET.parse(template_path.__str__())
-        root = tree.getroot()
-        root.append(ET.fromstring(page))
+        if style not in CDXMLSlideGenerator._TEMPLATE_CACHE:
+            template_name = style + ".cdxml"
+            module_path = Path(__file__).parent
+            template_path = module_path / template_name
+            CDXMLSlideGenerator._TEMPLATE_CACHE[style] = ET.fromstring(template_path.read_bytes(), self._parser)
+        root = copy.deepcopy(CDXMLSlideGenerator._TEMPLATE_CACHE[style])
+        page = ET.fromstring(page, self._parser)
+        root.append(page)
+        # cached as they are needed for every molecule and color added to the slide
+        self._page = page
+        self._colortable = root.find("colortable")
 
         # register fonts
         fonttable_xml = root.find("fonttable")
@@ -394,19 +426,14 @@ class CDXMLSlideGenerator(object):
         if color.rgb == (1, 1, 1):
             return 1  # white
 
-        if color.hex not in self.colortable:
-
-            colortable_xml = self.slide.find("colortable")
-            c = ET.SubElement(colortable_xml, "color")
-            c.attrib["r"] = str(color.rgb[0])
-            c.attrib["g"] = str(color.rgb[1])
-            c.attrib["b"] = str(color.rgb[2])
+        color_index = self.colortable.get(color.hex)
+        if color_index is None:
+            r, g, b = color.rgb
+            ET.SubElement(self._colortable, "color", {"r": str(r), "g": str(g), "b": str(b)})
             # 0=black, 1=white,2=bg,3=fg
             color_index = len(self.colortable) + 4
             self.colortable[color.hex] = color_index
-            return color_index
-        else:
-            return self.colortable[color.hex]
+        return color_index
 
 
 class TextProperty(object):
@@ -463,8 +490,8 @@ class FontColor(object):
     @staticmethod
     def hex_to_rgb(hex_code):
         # from stackoverflow
-        hex_code = hex_code.lstrip("#").upper()
-        rgb = tuple(int(hex_code[i:i + 2], 16) for i in (0, 2, 4))
+        hex_code = hex_code.lstrip("#")
+        rgb = (int(hex_code[0:2], 16), int(hex_code[2:4], 16), int(hex_code[4:6], 16))
         return FontColor._scale_color(rgb)
 
     @staticmethod
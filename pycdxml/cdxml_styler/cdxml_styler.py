@@ -10,9 +10,37 @@ import yaml
 
 logger = logging.getLogger('pycdxml.cdxml_styler')
 
+# compiled once instead of on every call. Elements on a page outside any fragment and the texts of query bonds
+_NON_FRAGMENT_PAGE_ELEMENTS = ET.XPath("//page/*[not(ancestor-or-self::fragment)]")
+_QUERY_BOND_TEXTS = ET.XPath('b/objecttag[@Name="query"]/t/s')
+
+# node attributes that are removed so that the document level settings apply
+_UNWANTED_NODE_ATTRIBUTES = ('LabelFont', 'LabelSize', 'LabelFace', 'LineWidth')
+# the only attributes kept on atom labels (t elements) and bonds
+_TEXT_ATTRIBUTES = frozenset(['p', 'BoundingBox', 'LabelJustification', 'LabelAlignment', 'Z'])
+_BOND_ATTRIBUTES = frozenset(['id', 'Z', 'B', 'E', 'BS', 'Order', 'BondCircularOrdering', 'Display'])
+
+
+def _parse_points(points: list) -> np.ndarray:
+    """
+    Parses a list of coordinate strings like the 'p' attribute into an array with one row per point. All values are
+    converted in a single numpy call instead of a float() call per value.
+    """
+    return np.array([p.split() for p in points], dtype=np.float64)
+
+
+def _load_styles() -> dict:
+
+    styles_path = Path(__file__).parent / 'styles.yml'
+    with open(styles_path, 'r') as stream:
+        return yaml.safe_load(stream)
+
 
 class CDXMLStyler(object):
 
+    # built-in named styles, loaded once on import
+    STYLES = _load_styles()
+
     def __init__(self, style_name: str = "ACS 1996", style_source=None, style_dict: dict = None):
         """
         The output style can be defined by selecting one of the built-in styles (ACS 1996 or Wiley), by
@@ -53,7 +81,7 @@ class CDXMLStyler(object):
         :param cdxml_path: path of cdxml file to convert
         :param outpath: path to write converted file. If None overwrite input file.
         """
-        logger.debug("Applying style {} to file {}.".format(self.style, cdxml_path))
+        logger.debug(f"Applying style {self.style} to file {cdxml_path}.")
         tree = ET.parse(cdxml_path)
         root = tree.getroot()
         result = self._apply_style(root)
@@ -64,7 +92,7 @@ class CDXMLStyler(object):
             outpath = cdxml_path
         with open(outpath, "w", encoding='UTF-8') as xf:
             xf.write(xml)
-        logger.debug("Style successfully applied and written output to file {}.".format(outpath))
+        logger.debug(f"Style successfully applied and written output to file {outpath}.")
 
     def apply_style_to_string(self, cdxml: str) -> str:
         """
@@ -74,7 +102,7 @@ class CDXMLStyler(object):
 
         :return: string containing cdxml with the desired style applied
         """
-        logger.debug("Applying style {} to a cdxml string.".format(self.style))
+        logger.debug(f"Applying style {self.style} to a cdxml string.")
         root = ET.fromstring(bytes(cdxml, encoding='utf8'))
         result = self._apply_style(root)
         logger.debug("Style applied. Returning result cdxml string.")
@@ -88,6 +116,16 @@ class CDXMLStyler(object):
         """
         self._apply_style(doc.cdxml.getroot())
 
+    def apply_style_to_element(self, root: ET.Element) -> ET.Element:
+        """
+        Applies style to the given root element of a cdxml document. The element is modified in place.
+
+        :param root: root element of the cdxml document
+        :return: the passed in root element with the desired style applied
+        """
+        logger.debug(f"Applying style {self.style} to a cdxml element.")
+        return self._apply_style(root)
+
     def _apply_style(self, root: ET.Element) -> ET.Element:
         """
         Applies the selected style to the input cdxml string and all contained drawings and returns the modified
@@ -120,10 +158,23 @@ class CDXMLStyler(object):
 
         bond_length = float(self.style["BondLength"])
 
+        # label settings are the same for every text, only look them up once
+        label_size = self.style["LabelSize"]
+        label_face = self.style["LabelFace"]
+        label_font = str(font_id)
+        # I label face by default is 96 for formula. if it is also bold it would be 98
+        # 98 - 96 = 2 and we add that to the superscript style of 64 -> 66 -> bold superscript
+        superscript_face = str(64 | (int(label_face) - 96))
+        # bond labels of query bonds like the S/D bond type are smaller
+        query_label_size = str(float(label_size) * 0.75)
+        add_implicit_hs = self.style["HideImplicitHydrogens"] == "no"
+
         # Get all nodes (atoms) and bonds
         logger.debug("Start applying style to molecules.")
         try:
-            global_coords, global_avg_bl = CDXMLStyler.get_coords_for_document(root)
+            # coordinates and mapping of each fragment are read once and reused when styling the fragment
+            fragments = [(fragment, CDXMLStyler.get_coords_and_mapping(fragment)) for fragment in root.iter('fragment')]
+            global_coords, global_avg_bl = CDXMLStyler._get_document_coords([data for _, data in fragments])
             if global_avg_bl > 0:
                 scaling_factor = bond_length / global_avg_bl
             else:
@@ -133,49 +184,54 @@ class CDXMLStyler(object):
 
             # 3D attributes tobe deleted since they can't be transformed; BoundingBox is enough for correct rendering
             graphic_deletable = ['Center3D', 'MajorAxisEnd3D', 'MinorAxisEnd3D']
-            for element in root.xpath("//page/*[not(ancestor-or-self::fragment)]"):
+            bounded_elements = []
+            for element in _NON_FRAGMENT_PAGE_ELEMENTS(root):
                 if 'p' in element.attrib:
                     # set new coordinates for p outside any fragment
                     p_coords = element.attrib['p']
                     p_coords = [float(c) * scaling_factor for c in p_coords.split(' ')]
-                    p_coords = [p_coords[0] + x_translate, p_coords[1] + y_translate]
-                    coords_label = str(p_coords[0]) + ' ' + str(p_coords[1])
-                    element.attrib['p'] = coords_label
+                    element.attrib['p'] = f"{p_coords[0] + x_translate} {p_coords[1] + y_translate}"
 
                 if 'BoundingBox' in element.attrib:
-                    geometry.fix_bounding_box(element, x_translate, y_translate, scaling_factor)
+                    bounded_elements.append(element)
 
                 if element.tag == 'graphic':
                     for gda in graphic_deletable:
                         if gda in element.attrib:
                             del element.attrib[gda]
+            geometry.fix_bounding_boxes(bounded_elements, x_translate, y_translate, scaling_factor)
 
-            for fragment in root.iter('fragment'):
-                logger.debug("Applying style to fragment with id {}.".format(fragment.attrib["id"]))
-                CDXMLStyler.add_missing_bounding_box(fragment)
-                logger.debug("Getting coordinates and mapping.")
-                all_coords, node_id_mapping, bonds, label_coords = CDXMLStyler.get_coords_and_mapping(fragment)
+            for fragment, (all_coords, node_id_mapping, bonds, label_coords) in fragments:
+                logger.debug(f"Applying style to fragment with id {fragment.attrib['id']}.")
+                if next(fragment.iterancestors('fragment'), None) is None:
+                    CDXMLStyler.add_missing_bounding_box(fragment, all_coords)
+                else:
+                    # nodes of a nested fragment were already moved together with the enclosing fragment
+                    CDXMLStyler.add_missing_bounding_box(fragment)
+                    logger.debug("Getting coordinates and mapping.")
+                    all_coords, node_id_mapping, bonds, label_coords = CDXMLStyler.get_coords_and_mapping(fragment)
 
                 num_nodes = len(node_id_mapping)
                 if num_nodes == 0:
                     raise ValueError("Molecule has no Atoms")
 
-                scaled_coords = all_coords * scaling_factor
-
                 logger.debug("Determining new coordinates.")
-                final_coords = geometry.translate(scaled_coords, x_translate, y_translate)
+                final_coords = geometry.scale_translate(all_coords, scaling_factor, x_translate, y_translate)
                 # Scale atom labels
                 if len(label_coords) > 0:
-                    scaled_labels = label_coords * scaling_factor
+                    final_labels = label_coords * scaling_factor
                     x_translate_label, y_translate_label = \
-                        geometry.get_translation(label_coords, scaled_labels)
-                    final_labels = geometry.translate(scaled_labels, x_translate_label, y_translate_label)
+                        geometry.get_translation(label_coords, final_labels)
+                    # scaled labels aren't needed anymore, translate in place
+                    final_labels += (x_translate_label, y_translate_label)
+                    # formatting python floats is much faster than calling str() on numpy scalars
+                    label_positions = iter([f"{x} {y}" for x, y in final_labels.tolist()])
 
-                # bounding box of fragment
-                geometry.fix_bounding_box(fragment, x_translate, y_translate, scaling_factor)
+                # bounding box of fragment and its graphics
+                graphics = list(fragment.iter('graphic'))
+                geometry.fix_bounding_boxes([fragment] + graphics, x_translate, y_translate, scaling_factor)
 
-                for graphic in fragment.iter('graphic'):
-                    geometry.fix_bounding_box(graphic, x_translate, y_translate, scaling_factor)
+                for graphic in graphics:
                     for gda in graphic_deletable:
                         if gda in graphic.attrib:
                             del graphic.attrib[gda]
@@ -185,54 +241,49 @@ class CDXMLStyler(object):
 
                 logger.debug("Applying new coordinates and label styles.")
 
-                unwanted_node_attributes = ['LabelFont', 'LabelSize', 'LabelFace', 'LineWidth']
-                t_attributes = ['p', 'BoundingBox', 'LabelJustification', 'LabelAlignment', 'Z']
-
-                idx = 0
-                label_idx = 0
-                for node in fragment.iter('n'):
-                    coords_xml = str(final_coords[idx][0]) + " " + str(final_coords[idx][1])
-                    node.attrib['p'] = coords_xml
+                for node, (x, y) in zip(fragment.iter('n'), final_coords.tolist()):
+                    node.attrib['p'] = f"{x} {y}"
 
-                    for unwanted_key in unwanted_node_attributes:
-                        logger.info("Deleting unneeded attribute {} from node element.".format(unwanted_key))
+                    for unwanted_key in _UNWANTED_NODE_ATTRIBUTES:
                         if unwanted_key in node.attrib:
+                            logger.info(f"Deleting unneeded attribute {unwanted_key} from node element.")
                             del node.attrib[unwanted_key]
 
+                    # number of implicit hydrogens to add or remove from the label, 0 if the display doesn't change
+                    if implicit_h_changed and "NumHydrogens" in node.attrib:
+                        num_hydrogens = int(node.attrib["NumHydrogens"])
+                    else:
+                        num_hydrogens = 0
+
                     for t in node.iter('t'):
                         if 'p' in t.attrib:
                             # set new coordinates for labels (t elements)
-                            coords_label = str(final_labels[label_idx][0]) + " " + str(final_labels[label_idx][1])
-                            t.attrib['p'] = coords_label
-                            label_idx += 1
+                            t.attrib['p'] = next(label_positions)
 
-                        unwanted = set(t.attrib) - set(t_attributes)
+                        unwanted = [key for key in t.attrib if key not in _TEXT_ATTRIBUTES]
                         for unwanted_key in unwanted:
-                            logger.info("Deleting unneeded attribute {} from text element.".format(unwanted_key))
+                            logger.info(f"Deleting unneeded attribute {unwanted_key} from text element.")
                             del t.attrib[unwanted_key]
 
                         for s in t.iter('s'):
-                            s.attrib["size"] = self.style["LabelSize"]
+                            s.attrib["size"] = label_size
                             # see https://www.cambridgesoft.com/services/documentation/sdk/chemdraw/cdx/DataType/CDXString.htm
                             # for explanation on magic numbers. 64 = superscript, >64 with additional styling
                             # eg, 65 would be superscript and bold
                             if "face" in s.attrib and int(s.attrib["face"]) ^ 64 < 32:
                                 # preserve style of superscript if default label face is bold or italic
-                                # I label face by default is 96 for formula. if it is also bold it would be 98
-                                # 98 - 96 = 2 and we add that to the superscript style of 64 -> 66 -> bold superscript
-                                s.attrib["face"] = str(64 | (int(self.style["LabelFace"]) - 96))
+                                s.attrib["face"] = superscript_face
                             else:
                                 # by default this is usually 96 for atom labels which handles subscripts automatically
-                                s.attrib["face"] = self.style["LabelFace"]
-                            s.attrib["font"] = str(font_id)
+                                s.attrib["face"] = label_face
+                            s.attrib["font"] = label_font
 
                             # Change implicit hydrogen display if needed
-                            if implicit_h_changed \
-                                    and "NumHydrogens" in node.attrib and int(node.attrib["NumHydrogens"]) > 0:
-                                if self.style["HideImplicitHydrogens"] == "no":
+                            if num_hydrogens > 0:
+                                if add_implicit_hs:
                                     # add implicit Hs to text
                                     txt = s.text
-                                    if int(node.attrib["NumHydrogens"]) == 1:
+                                    if num_hydrogens == 1:
                                         txt += "H"
                                     else:
                                         txt += "H" + str(node.attrib["NumHydrogens"])
@@ -247,14 +298,13 @@ class CDXMLStyler(object):
                                         # Two letter atom Symbol
                                         txt = txt[:2]
                                     s.text = txt
-                    idx += 1
 
                 # scale font size of bond labels for query bonds like the S/D bond type
-                query_bond_texts = fragment.xpath('b/objecttag[@Name="query"]/t/s')
+                query_bond_texts = _QUERY_BOND_TEXTS(fragment)
                 for s in query_bond_texts:
-                    s.attrib["size"] = str(float(self.style["LabelSize"]) * 0.75)
-                    s.attrib["face"] = self.style["LabelFace"]
-                    s.attrib["font"] = str(font_id)
+                    s.attrib["size"] = query_label_size
+                    s.attrib["face"] = label_face
+                    s.attrib["font"] = label_font
 
             return root
 
@@ -267,30 +317,41 @@ class CDXMLStyler(object):
                              "This is the case if the key error is caused by a missing key of 'p'.") from err
 
     @staticmethod
-    def add_missing_bounding_box(fragment: ET.Element):
-
+    def add_missing_bounding_box(fragment: ET.Element, all_coords: np.ndarray = None):
+        """
+        Adds the BoundingBox of the fragment if it is missing. If given, all_coords must be the coordinates of all
+        nodes of the fragment so that they don't need to be parsed again.
+        """
         if 'BoundingBox' not in fragment.attrib:
-            all_coords = []
-            for node in fragment.iter('n'):
-                if 'p' in node.attrib:
-                    coords_raw = node.attrib['p']
-                    coords = [float(x) for x in coords_raw.split(" ")]
-                    all_coords.append(coords)
-                else:
-                    raise ValueError("Molecule has no coordinates")
+            if all_coords is None:
+                points = []
+                for node in fragment.iter('n'):
+                    if 'p' in node.attrib:
+                        points.append(node.attrib['p'])
+                    else:
+                        raise ValueError("Molecule has no coordinates")
+                all_coords = _parse_points(points)
             # add missing BoundingBox
-            all_coords = np.asarray(all_coords)
             max_x, max_y = all_coords.max(axis=0)
             min_x, min_y = all_coords.min(axis=0)
-            fragment.attrib['BoundingBox'] = "{} {} {} {}".format(min_x, min_y, max_x, max_y)
+            fragment.attrib['BoundingBox'] = f"{min_x} {min_y} {max_x} {max_y}"
 
     @staticmethod
     def get_coords_for_document(root: ET.Element):
+
+        return CDXMLStyler._get_document_coords([CDXMLStyler.get_coords_and_mapping(fragment)
+                                                 for fragment in root.iter('fragment')])
+
+    @staticmethod
+    def _get_document_coords(fragment_data: list):
+        """
+        Gets all coordinates and the average bond length of the biggest fragment from the result of
+        get_coords_and_mapping for every fragment of the document
+        """
         all_coords_doc = []
         bond_counts = []
         bond_lengths = []
-        for fragment in root.iter('fragment'):
-            all_coords, node_id_mapping, bonds, label_coords = CDXMLStyler.get_coords_and_mapping(fragment)
+        for all_coords, node_id_mapping, bonds, label_coords in fragment_data:
             if len(bonds) > 0:
                 avg_bl = CDXMLStyler.get_avg_bl(all_coords, bonds, node_id_mapping)
                 bond_counts.append(len(bonds))
@@ -307,39 +368,29 @@ class CDXMLStyler(object):
     @staticmethod
     def get_coords_and_mapping(fragment: ET.Element) -> tuple:
 
-        bond_attributes = ['id', 'Z', 'B', 'E', 'BS', 'Order', 'BondCircularOrdering', 'Display']
-
-        all_coords = []
+        points = []
         node_id_mapping = {}
-        label_coords = []
-        label_bbs = []
+        label_points = []
         bonds = []
 
-        idx = 0
-        for node in fragment.iter('n'):
-            coords_raw = node.attrib['p']
-            coords = [float(x) for x in coords_raw.split(" ")]
-            all_coords.append(coords)
+        for idx, node in enumerate(fragment.iter('n')):
+            points.append(node.attrib['p'])
             node_id_mapping[int(node.attrib['id'])] = idx
             for t in node.iter('t'):
                 if 'p' in t.attrib:
-                    label_p = [float(x) for x in t.attrib['p'].split(" ")]
-                    label_coords.append(label_p)
-                    label_bb = [float(x) for x in t.attrib['BoundingBox'].split(" ")]
-                    label_bbs.append(label_bb)
-            idx += 1
+                    label_points.append(t.attrib['p'])
         for bond in fragment.iter('b'):
             bond_dict = {'start': int(bond.attrib['B']), 'end': int(bond.attrib['E'])}
             bonds.append(bond_dict)
             # Remove bond attributes set at bond level
             # Removing them will use the document level settings
-            unwanted = set(bond.attrib) - set(bond_attributes)
+            unwanted = [key for key in bond.attrib if key not in _BOND_ATTRIBUTES]
             for unwanted_key in unwanted:
-                logger.info("Deleting unneeded attribute {} from bond element.".format(unwanted_key))
+                logger.info(f"Deleting unneeded attribute {unwanted_key} from bond element.")
                 del bond.attrib[unwanted_key]
 
-        all_coords = np.asarray(all_coords)
-        label_coords = np.asarray(label_coords)
+        all_coords = _parse_points(points)
+        label_coords = _parse_points(label_points)
 
         return all_coords, node_id_mapping, bonds, label_coords
 
@@ -357,16 +408,10 @@ class CDXMLStyler(object):
 
        """
 
-        a = []
-        b = []
-        for bond in bonds:
-            index_start = node_id_mapping[bond['start']]
-            index_end = node_id_mapping[bond['end']]
-            a.append(all_coords[index_start])
-            b.append(all_coords[index_end])
-
-        a = np.asarray(a)
-        b = np.asarray(b)
+        index_start = np.fromiter((node_id_mapping[bond['start']] for bond in bonds), dtype=np.intp, count=len(bonds))
+        index_end = np.fromiter((node_id_mapping[bond['end']] for bond in bonds), dtype=np.intp, count=len(bonds))
+        a = all_coords[index_start]
+        b = all_coords[index_end]
 
         bond_length = np.linalg.norm(a - b, axis=1)  # thanks to stackoverflow
         avg_bl = round(np.mean(bond_length), 1)
@@ -376,28 +421,17 @@ class CDXMLStyler(object):
     def fix_curve_points(element: ET.Element, xt: float, yt: float, scaling_factor: float):
         if 'CurvePoints' not in element.attrib:
             return
-        p_val = element.attrib['CurvePoints']
-        frs = p_val.split(' ')
-        trans_array = []
-        for idx in range(0, len(frs)):
-            if idx % 2 == 0:
-                trans_array.append(float(frs[idx]) * scaling_factor + xt)
-            else:
-                trans_array.append(float(frs[idx]) * scaling_factor + yt)
-        trans_array = np.round(trans_array, 2)
-        trans_array_text = [str(f) for f in trans_array]
-        element.attrib['CurvePoints'] = ' '.join(trans_array_text)
+        # flat list of alternating x and y values
+        trans_array = np.array(element.attrib['CurvePoints'].split(), dtype=np.float64)
+        trans_array *= scaling_factor
+        trans_array[0::2] += xt
+        trans_array[1::2] += yt
+        np.round(trans_array, 2, out=trans_array)
+        element.attrib['CurvePoints'] = ' '.join(map(str, trans_array.tolist()))
 
     @staticmethod
     def get_style(style_name):
 
-        if not hasattr(CDXMLStyler, "STYLES"):
-            module_path = Path(__file__).parent
-
-            styles_path = module_path / 'styles.yml'
-            with open(styles_path, 'r') as stream:
-                CDXMLStyler.STYLES = yaml.safe_load(stream)
-
         if style_name in CDXMLStyler.STYLES:
             return CDXMLStyler.STYLES[style_name]
         else:
@@ -3,6 +3,10 @@ import re
 
 CDXML_HEADER = """<?xml version="1.0" encoding="UTF-8" ?>
 """
+_CDXML_DOCTYPE = "<!DOCTYPE CDXML SYSTEM \"http://www.cambridgesoft.com/xml/cdxml.dtd\" >"
+
+# legacy attributes like attrib4000 with a long hex value, see clean_cdxml
+_LEGACY_ATTRIBUTES = re.compile(r"(?m) attrib[a-z0-9]{4,}=\".+?\"\r?\n")
 
 
 def etree_to_cdxml(xml: ET, pretty_print: bool = True) -> str:
@@ -12,9 +16,7 @@ def etree_to_cdxml(xml: ET, pretty_print: bool = True) -> str:
     """
     if pretty_print:
         ET.indent(xml, space="\t")
-    xml = ET.tostring(xml, encoding='unicode', method='xml',
-                      doctype="<!DOCTYPE CDXML SYSTEM \"http://www.cambridgesoft.com/xml/cdxml.dtd\" >",
-                      pretty_print=pretty_print)
+    xml = ET.tostring(xml, encoding='unicode', method='xml', doctype=_CDXML_DOCTYPE, pretty_print=pretty_print)
     return CDXML_HEADER + xml
 
 
@@ -28,7 +30,7 @@ def clean_cdxml(cdxml: str) -> str:
     This method cleans up this "legacy junk".
     """
 
-    cdxml = re.sub(r"(?m) attrib[a-z0-9]{4,}=\".+?\"\r?\n", "", cdxml)
+    cdxml = _LEGACY_ATTRIBUTES.sub("", cdxml)
     cdxml = cdxml.replace(" color=\"|x|0000\"\n", "")
     cdxml = cdxml.replace(" bgcolor=\"|x|0100\"\n", "")
 
@@ -1,26 +1,42 @@
 from fontTools.ttLib import TTFont
 from matplotlib import font_manager
+import functools
+import weakref
 
+# glyph widths per font, dropped together with the font
+_GLYPH_WIDTHS = weakref.WeakKeyDictionary()
 
-def get_font_by_name(name: str, fallback_to_default=False):
+
+def get_font_by_name(name: str, fallback_to_default=True):
+    """
+    Returns the TTFont of the given font-name. If the font is not found, the default font is returned unless
+    fallback_to_default is False.
+    Raises ValueError if font is not found and fallback_to_default is False
+    """
+    return TTFont(_find_font_path(name, fallback_to_default))
+
+
+@functools.lru_cache(maxsize=64)
+def _find_font_path(name: str, fallback_to_default: bool) -> str:
+    return font_manager.findfont(name, fontext='ttf', fallback_to_default=fallback_to_default)
+
+
+def _get_glyph_widths(font: TTFont) -> tuple:
     """
-    Returns path to ttf-file of the given font-name
-    Raises ValueError if font is not found
+    Returns the advance width of each code point of the font, the width of a missing glyph and the units per em
     """
-    font_path = font_manager.findfont("Arial", fontext='ttf', fallback_to_default=True)
-    return TTFont(font_path)
+    glyph_widths = _GLYPH_WIDTHS.get(font)
+    if glyph_widths is None:
+        glyph_set = font.getGlyphSet()
+        widths = {code: glyph_set[glyph_name].width for code, glyph_name in font['cmap'].getBestCmap().items()
+                  if glyph_name in glyph_set}
+        glyph_widths = (widths, glyph_set['.notdef'].width, font['head'].unitsPerEm)
+        _GLYPH_WIDTHS[font] = glyph_widths
+    return glyph_widths
 
 
 def get_text_width(text, font: TTFont, font_size: int):
-    cmap = font['cmap']
-    t = cmap.getBestCmap()
-    s = font.getGlyphSet()
-    units_per_em = font['head'].unitsPerEm
-    total = 0
-    for c in text:
-        if ord(c) in t and t[ord(c)] in s:
-            total += s[t[ord(c)]].width
-        else:
-            total += s['.notdef'].width
-    total = total*float(font_size)/units_per_em;
-    return total
\ No newline at end of file
+    widths, notdef_width, units_per_em = _get_glyph_widths(font)
+    total = sum(widths.get(ord(c), notdef_width) for c in text)
+    total = total*float(font_size)/units_per_em
+    return total
@@ -3,18 +3,34 @@ from lxml import etree as ET
 
 
 def fix_bounding_box(element: ET.Element, xt: float, yt: float, scaling_factor: float = None):
-    bounding_box = np.asarray([float(x) for x in element.attrib['BoundingBox'].split(" ")])
-    translation = np.array([xt, yt, xt, yt])
+    final_coords = np.asarray([float(x) for x in element.attrib['BoundingBox'].split(" ")])
 
-    if scaling_factor is None:
-        final_coords = bounding_box + translation
-    else:
-        scaled_coords = bounding_box * scaling_factor
-        final_coords = scaled_coords + translation
+    # scale, translate and round all in place
+    if scaling_factor is not None:
+        final_coords *= scaling_factor
+    final_coords += (xt, yt, xt, yt)
+    np.round(final_coords, 2, out=final_coords)
+    # formatting python floats is much faster than calling str() on numpy scalars
+    left, top, right, bottom = final_coords.tolist()
 
-    final_coords = np.round(final_coords, 2)
+    element.attrib['BoundingBox'] = f"{left} {top} {right} {bottom}"
 
-    element.attrib['BoundingBox'] = f"{final_coords[0]} {final_coords[1]} {final_coords[2]} {final_coords[3]}"
+
+def fix_bounding_boxes(elements: list, xt: float, yt: float, scaling_factor: float = None):
+    """
+    Same as fix_bounding_box for many elements at once with all bounding boxes transformed in one array
+    """
+    if len(elements) == 0:
+        return
+    final_coords = np.asarray([[float(x) for x in element.attrib['BoundingBox'].split(" ")] for element in elements])
+
+    if scaling_factor is not None:
+        final_coords *= scaling_factor
+    final_coords += (xt, yt, xt, yt)
+    np.round(final_coords, 2, out=final_coords)
+
+    for element, (left, top, right, bottom) in zip(elements, final_coords.tolist()):
+        element.attrib['BoundingBox'] = f"{left} {top} {right} {bottom}"
 
 
 def get_element_center(element: ET.Element) -> np.ndarray:
@@ -92,6 +108,26 @@ def translate(coords, x_translate, y_translate):
     return final_coords
 
 
+def scale_translate(coords, scaling_factor, x_translate, y_translate):
+    """Scales the input coordinates and then translates them by the given x and y translation amount.
+    Same result as scaling followed by translate but without an intermediate array.
+
+    Parameters:
+    coords (numpy): coordinates of all elements to transform
+    scaling_factor: factor to multiply the coordinates with
+    x_translate: amount to translate on x-axis
+    y_translate: amount to translate on y-axis
+
+
+    Returns:
+    numpy: array of scaled and translated coordinates
+
+   """
+    final_coords = coords * scaling_factor
+    final_coords += (x_translate, y_translate)
+    return final_coords
+
+
 def get_distance(point_a: np.ndarray, point_b: np.ndarray):
     # This works because the Euclidean distance is the l2 norm, and the default value of the ord parameter in
     # numpy.linalg.norm is 2.
@@ -1,10 +1,15 @@
 from pathlib import Path
+import os
 from lxml import etree as ET
 from pycdxml.cdxml_converter import read_cdx
+import functools
 import logging
 
 logger = logging.getLogger('pycdxml.utils.style')
 
+# compiled once instead of on every call
+_FONTTABLE = ET.XPath("./fonttable")
+
 
 def get_style_from_template(template):
     """
@@ -12,22 +17,16 @@ def get_style_from_template(template):
 
     :param template: a file object, a path or str to a cdx or cdxml file or a string containing the xml
     """
-    if isinstance(template, str):
-        p = Path(template)
-    elif isinstance(template, Path):
-        p = template
-    else:
+    if isinstance(template, Path):
+        template = str(template)
+    elif not isinstance(template, str):
         raise TypeError(f"Expected str or Path but got {type(template)} instead.")
 
-    if p.exists():
-        if p.suffix == '.cdxml':
-            with open(template, mode='r') as file:
-                cdxml = file.read()
-                style_dict = cdxml_str_to_style_dict(cdxml)
-        elif p.suffix == '.cdx' or p.suffix == '.cds':
-            doc = read_cdx(template)
-            cdxml = doc.to_cdxml()
-            style_dict = cdxml_str_to_style_dict(cdxml)
+    # os.path instead of pathlib as no Path object is needed to check and resolve the file
+    if os.path.isfile(template):
+        path = os.path.realpath(template)
+        # copy so that changes by the caller don't end up in the cache
+        style_dict = dict(_get_style_from_file(path, os.stat(path).st_mtime_ns))
     elif template.startswith("<?xml"):
         style_dict = cdxml_str_to_style_dict(template)
     else:
@@ -36,21 +35,74 @@ def get_style_from_template(template):
     return style_dict
 
 
-def cdxml_str_to_style_dict(cdxml: str):
-    cdxml = cdxml.encode('utf-8')
-    tree = ET.fromstring(cdxml)
+@functools.lru_cache(maxsize=32)
+def _get_style_from_file(path: str, mtime: int):
+    """
+    Style of a template file. Cached as usually the same template is used over and over again. The modification time
+    is part of the key so that changes to the file are picked up.
+    """
+    suffix = os.path.splitext(path)[1]
+    if suffix == '.cdxml':
+        style_dict = cdxml_path_to_style_dict(path)
+    elif suffix == '.cdx' or suffix == '.cds':
+        doc = read_cdx(path)
+        # the converted document already is an element tree, no need to write it to cdxml and parse it again
+        style_dict = _root_to_style_dict(doc.cdxml.getroot())
+
+    return style_dict
+
+
+def cdxml_str_to_style_dict(cdxml):
+    """
+    Generates a style dict from cdxml given as str or as bytes
+    """
+    if isinstance(cdxml, str):
+        cdxml = cdxml.encode('utf-8')
+    return _root_to_style_dict(ET.fromstring(cdxml))
+
+
+def cdxml_path_to_style_dict(path):
+    """
+    Generates a style dict from a cdxml file. The file is read by the parser directly and it handles the encoding.
+
+    Only the root attributes and the fonttable are needed so parsing stops once the fonttable has been read.
+    """
+    with open(path, "rb") as f:
+        context = ET.iterparse(f, events=("end",), tag="fonttable")
+        for _, font_table in context:
+            if font_table.getparent() is context.root:
+                break
+        return _root_to_style_dict(context.root)
+
+
+def _root_to_style_dict(tree: ET.Element) -> dict:
+    # plain dict so that the tree is not modified and doesn't need to be kept alive
+    style_dict = dict(tree.attrib)
     # determine default font
-    font_table = get_font_table(tree)
-    style_dict = tree.attrib
     font_id = int(style_dict["LabelFont"])
-    style_dict["LabelFont"] = font_table.get_font_name(font_id)
+    style_dict["LabelFont"] = _get_font_name(tree, font_id)
     return style_dict
 
 
+def _get_font_name(cdxml: ET.Element, font_id: int) -> str:
+    """
+    Returns the name of the font with font_id from the font table without building a complete FontTable.
+    Searches from the end as in a FontTable a later font with the same id replaces an earlier one.
+    """
+    found = _FONTTABLE(cdxml)
+    if found:
+        for font in found[0].iterchildren("font", reversed=True):
+            if int(font.attrib["id"]) == font_id:
+                return font.attrib["name"]
+    raise KeyError(font_id)
+
+
 def get_font_table(cdxml: ET.Element):
 
-    fonttable_xml = cdxml.find("fonttable")
-    if fonttable_xml is None:
+    found = _FONTTABLE(cdxml)
+    if found:
+        fonttable_xml = found[0]
+    else:
         fonttable_xml = ET.SubElement(cdxml, 'fonttable')
     font_table = FontTable(fonttable_xml)
     return font_table
@@ -68,23 +120,23 @@ class FontTable:
         if font_table is None:
             raise ValueError("font_table argument can't be None.")
         self.font_table = font_table
-        self.font_table_dict = {}
-        # initialize helper dict
-        for font in font_table.iter("font"):
-            font_name = font.attrib["name"]
-            font_id = int(font.attrib["id"])
-            self.font_table_dict[font_id] = font_name
+        # initialize helper dict. get() reads the attribute directly without creating an attrib proxy
+        self.font_table_dict = {int(font.get("id")): font.get("name") for font in font_table.iter("font")}
+        # reverse lookup of font id by name. If a name is present multiple times, the first id is used
+        self._font_ids = {}
+        for font_id, font_name in self.font_table_dict.items():
+            self._font_ids.setdefault(font_name, font_id)
+        # highest font id, new fonts get the next id
+        self._max_font_id = max(self.font_table_dict.keys(), default=0)
 
     def get_font_name(self, font_id: int) -> str:
         return self.font_table_dict[font_id]
 
     def get_font_id(self, font_name) -> int:
-        for key, value in self.font_table_dict.items():
-            if font_name == value:
-                return key
+        return self._font_ids.get(font_name)
 
     def contains_font(self, font_name):
-        return font_name in self.font_table_dict.values()
+        return font_name in self._font_ids
 
     def get_default_font_id(self):
         """
@@ -106,16 +158,15 @@ class FontTable:
         if self.contains_font(font_name):
             return self.get_font_id(font_name)
         else:
-            if len(self.font_table_dict) > 0:
-                font_id = max(self.font_table_dict.keys()) + 1
-            else:
-                # first font entry
-                font_id = 1
+            # first font entry gets id 1
+            font_id = self._max_font_id + 1
+            self._max_font_id = font_id
 
             c = ET.SubElement(self.font_table, 'font')
             c.attrib["id"] = str(font_id)
             c.attrib["charset"] = charset
             c.attrib["name"] = font_name
             self.font_table_dict[font_id] = font_name
+            self._font_ids[font_name] = font_id
             return font_id
 
@@ -1,8 +1,12 @@
 import os
+import tempfile
 import unittest
 from pycdxml import cdxml_converter
+from pycdxml import cdxml_styler
+from pycdxml.utils import cdxml_io
 import rdkit
 from rdkit import Chem
+from rdkit.Geometry import Point3D
 import filecmp
 from pathlib import Path
 import logging
@@ -103,6 +107,113 @@ class CdxmlConverterTest(unittest.TestCase):
             b64ref = f.read()
             self.assertEqual(b64cdx, b64ref, "Generated b64cdx file for represents test does not match expected output.")
 
+    def test_curve_points_from_string(self):
+        curve_points = cdxml_converter.CDXCurvePoints.from_string("1.5 2 3 4.25")
+        self.assertEqual(curve_points.to_property_value(), "1.5 2.0 3.0 4.25")
+        for malformed in ["1 2 x 4", "1 2 3,4", "1 2 nan 4", "1 inf 3 4"]:
+            with self.assertRaises(ValueError):
+                cdxml_converter.CDXCurvePoints.from_string(malformed)
+
+    def test_attribute_with_unimplemented_type(self):
+        """
+        Test that an attribute whose property type is not implemented is handled as unknown attribute
+        """
+        doc = cdxml_converter.read_cdxml(self.standard_in_cdxml)
+        expected = doc.to_bytes()
+        doc.cdxml.getroot().find(".//n").attrib["Formula"] = "C2H6"
+        with self.assertRaises(cdxml_converter.UnknownPropertyException):
+            doc.to_bytes()
+        self.assertEqual(doc.to_bytes(ignore_unknown_attribute=True), expected)
+
+    def test_enum_string_roundtrip(self):
+        """
+        Test that all AtomGeometry and BioShapeType values including the ones starting with a digit can be read back
+        from their cdxml value
+        """
+        for klass in (cdxml_converter.CDXAtomGeometry, cdxml_converter.CDXBioShapeType):
+            for member in klass:
+                self.assertIs(klass.from_string(member.to_property_value()), member)
+        self.assertIs(cdxml_converter.CDXAtomGeometry.from_string("5"), cdxml_converter.CDXAtomGeometry.m_5)
+
+    def test_tag_types(self):
+        tag_types = [member.name for member in cdxml_converter.CDXTagType]
+        self.assertEqual(tag_types, ["Unknown", "Double", "Long", "String"])
+        self.assertEqual(list(cdxml_converter.TAG_TYPE_MAPPING), tag_types)
+        for member in cdxml_converter.CDXTagType:
+            self.assertIs(cdxml_converter.CDXTagType.from_string(member.to_property_value()), member)
+
+    def test_curve_points_bytes(self):
+        curve_points = cdxml_converter.CDXCurvePoints.from_string("1.5 2 3 4.25 -7 0.05")
+        cdx = curve_points.to_bytes()
+        self.assertEqual(cdx.hex(), "030000000200008001000040040000000300cc0c00000000f9ff")
+        self.assertEqual(cdxml_converter.CDXCurvePoints.from_bytes(cdx).to_property_value(),
+                         "1.5 2.0 3.0 4.25 -7.0 0.05")
+
+    def test_compressed_property_value(self):
+        compressed = cdxml_converter.CDXCompressed("pycdxml".encode("ascii"))
+        self.assertEqual(compressed.to_property_value(), "cHljZHhtbA==")
+        # the value follows reassigned data
+        compressed.data = "cdx".encode("ascii")
+        self.assertEqual(compressed.to_property_value(), "Y2R4")
+        self.assertEqual(compressed.to_bytes(), "cdx".encode("ascii"))
+
+    def test_compressed_from_string(self):
+        compressed = cdxml_converter.CDXCompressed.from_string("cHljZHhtbA==")
+        self.assertEqual(compressed.to_bytes(), "pycdxml".encode("ascii"))
+        self.assertEqual(compressed.to_property_value(), "cHljZHhtbA==")
+
+    def test_line_height_property_value(self):
+        self.assertEqual(cdxml_converter.CDXLineHeight(0).to_property_value(), "variable")
+        self.assertEqual(cdxml_converter.CDXLineHeight(1).to_property_value(), "auto")
+        for value in range(-1000, 1001):
+            if value not in (0, 1):
+                self.assertEqual(cdxml_converter.CDXLineHeight(value).to_property_value(), str(round(value / 20, 1)))
+
+    def test_int16_and_int32_types_bytes(self):
+        for klass in (cdxml_converter.CDXConnectivity, cdxml_converter.CDXSequenceType, cdxml_converter.CDXSideType):
+            for member in klass:
+                cdx = member.to_bytes()
+                self.assertEqual(cdx, member.value.to_bytes(2, byteorder='little', signed=True))
+                self.assertIs(klass.from_bytes(cdx), member)
+            with self.assertRaises(ValueError):
+                klass.from_bytes(bytes(4))
+        angle = cdxml_converter.CDXPositioningAngle.from_string("-1.5")
+        self.assertEqual(angle.to_bytes(), (-98304).to_bytes(4, byteorder='little', signed=True))
+        self.assertEqual(cdxml_converter.CDXPositioningAngle.from_bytes(angle.to_bytes()).to_property_value(), "-1.5")
+
+    def test_enum_values_to_bytes(self):
+        self.assertEqual(cdxml_converter.CDXConnectivity.Cyclic.to_bytes(), b'\x04\x00')
+        self.assertEqual(cdxml_converter.CDXSequenceType.Biopolymer.to_bytes(), b'\x06\x00')
+        self.assertEqual(cdxml_converter.CDXSideType.Right.to_bytes(), b'\x04\x00')
+
+    def test_cached_enum_from_string(self):
+        for klass in (cdxml_converter.CDXConnectivity, cdxml_converter.CDXSequenceType, cdxml_converter.CDXSideType):
+            for member in klass:
+                self.assertIs(klass.from_string(member.to_property_value()), member)
+                self.assertIs(klass.from_string(member.to_property_value()), member)
+            for _ in range(2):
+                with self.assertRaises(KeyError):
+                    klass.from_string("NotAValue")
+        self.assertIs(cdxml_converter.CDXSideType.from_string("left"), cdxml_converter.CDXSideType.Left)
+
+    def test_clean_cdxml(self):
+        cdxml = '<n id="1"\n attrib4000="0a0b0c"\n attrib044a="|x|00"\n color="|x|0000"\n bgcolor="|x|0100"\n Z="3"\r\n' \
+                ' attribabcd="x"\r\n/>'
+        self.assertEqual(cdxml_io.clean_cdxml(cdxml), '<n id="1"\n Z="3"\r\n/>')
+
+    def test_write_cdxml_file(self):
+        """
+        Test that the written cdxml file contains the document's cdxml with platform line endings
+        """
+        doc = cdxml_converter.read_cdxml(self.standard_in_cdxml)
+        cdxml_bytes = doc.to_cdxml().encode("UTF-8")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_path = os.path.join(tmp_dir, "out.cdxml")
+            cdxml_converter.write_cdxml_file(doc, out_path)
+            with open(out_path, "rb") as f:
+                written = f.read()
+        self.assertEqual(written, cdxml_bytes.replace(b"\n", os.linesep.encode("ascii")))
+
     def setUp(self):
         self.standard_in_cdx = 'tests/files/standard_test.cdx'
         self.standard_out_cdx = 'tests/files/standard_test_out.cdx'
@@ -190,6 +301,46 @@ class CdxmlConverterRoundTripTests(unittest.TestCase):
         fname = os.path.join('tests/files', 'CHEMBL4889297_coords.mol')
         self.roundtrip(fname)
 
+    def test_more_than_10000_objects(self):
+        """
+        Test that object ids don't run out for molecules with more than 10000 atoms and bonds
+        """
+        mol = Chem.MolFromSmiles("C" * 5100)
+        conformer = Chem.Conformer(mol.GetNumAtoms())
+        for idx in range(mol.GetNumAtoms()):
+            conformer.SetAtomPosition(idx, Point3D(idx * 1.3, (idx % 2) * 0.75, 0))
+        mol.AddConformer(conformer)
+        doc = cdxml_converter.mol_to_document(mol)
+        ids = [int(e.attrib["id"]) for e in doc.cdxml.getroot().iter("page", "fragment", "n", "b")]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertGreater(max(ids), 10000)
+
+    def test_atom_labels(self):
+        """
+        Test the atom label texts for charges, hydrogens and isotopes
+        """
+        expected = {"[NH4+]": ["NH4+"], "C[O-]": ["O-"], "[15NH3]": ["NH3"], "CCl": ["Cl"], "[Fe+3]": ["Fe+3"],
+                    "[S-2]": ["S-2"], "[CH3+]": ["CH3+"], "[2H]C": ["D"], "[NH2-]": ["NH2-"]}
+        for smiles, labels in expected.items():
+            # repeated to also cover the cached labels
+            for _ in range(2):
+                doc = cdxml_converter.mol_to_document(Chem.MolFromSmiles(smiles))
+                texts = ["".join(s.text for s in t.iter("s")) for t in doc.cdxml.getroot().iter("t")]
+                self.assertEqual(texts, labels)
+
+    def test_label_free_molecule_with_styler_style(self):
+        """
+        Test that a molecule without atom labels can be converted with a style from the styler. Such a style contains
+        the label font by name and not by id.
+        """
+        style = cdxml_styler.CDXMLStyler(style_name="Wiley").style
+        for smiles in ["CC=CC", "C/C=C/C", "c1ccc2ccccc2c1"]:
+            mol = Chem.MolFromSmiles(smiles)
+            doc = cdxml_converter.mol_to_document(mol, chemdraw_style=style)
+            nmols = Chem.MolsFromCDXML(doc.to_cdxml())
+            self.assertEqual(1, len(nmols))
+            self.assertEqual(nmols[0].GetNumAtoms(), mol.GetNumAtoms())
+
 
 if __name__ == '__main__':
     unittest.main()
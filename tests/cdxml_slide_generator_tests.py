@@ -1,5 +1,10 @@
 import unittest
-from pycdxml.cdxml_slide_generator import TextProperty, CDXMLSlideGenerator
+import gc
+import weakref
+from lxml import etree as ET
+from pycdxml.cdxml_slide_generator import TextProperty, CDXMLSlideGenerator, FontColor
+from pycdxml.utils import font_handling
+from pycdxml.utils.font_handling import get_font_by_name, get_text_width
 import filecmp
 from pathlib import Path
 import logging
@@ -21,6 +26,34 @@ class CdxmlSlideGeneratorTest(unittest.TestCase):
         with open('tests/files/test_slide_out.cdxml', 'w', encoding='utf8') as f:
             f.write(slide)
 
+    def test_repeated_documents(self):
+        """
+        Test that generating a slide twice from the same documents leads to the same slide and leaves the input as is
+        """
+        structures = self.test_structures * 2
+        properties = self.properties * 2
+        input_structures = list(structures)
+        sg = CDXMLSlideGenerator(style="ACS 1996", number_of_properties=2)
+        slide = sg.generate_slide(structures, properties)
+        self.assertEqual(sg.generate_slide(structures, properties), slide)
+        self.assertEqual(structures, input_structures)
+
+    def test_blank_text_removal(self):
+        """
+        Test that blank text in the input documents doesn't end up in the slide
+        """
+        sg = CDXMLSlideGenerator(style="ACS 1996", number_of_properties=2)
+        slide = sg.generate_slide(self.test_structures, self.properties)
+        # same documents with additional blank text between the elements
+        blank_structures = [cdxml.replace(">\n", ">\n  \n ") for cdxml in self.test_structures]
+        blank_slide = sg.generate_slide(blank_structures, self.properties)
+        self.assertEqual(blank_slide, slide)
+        root = ET.fromstring(blank_slide.encode("utf-8"))
+        for element in root.iter():
+            for text in (element.text, element.tail):
+                if text is not None and not text.strip():
+                    self.assertRegex(text, r"^\n\t*$")
+
     def setUp(self):
         self.test_structures = []
         self.properties = []
@@ -38,5 +71,64 @@ class CdxmlSlideGeneratorTest(unittest.TestCase):
     #         p.unlink()
 
 
+class FontColorTest(unittest.TestCase):
+
+    def test_hex_color(self):
+        for color in ["#3f6eba", "#3F6EBA", "#3f6eba"]:
+            font_color = FontColor(color)
+            self.assertEqual(font_color.hex, "#3F6EBA")
+            self.assertEqual(font_color.rgb, (0.25, 0.43, 0.73))
+
+    def test_rgb_color(self):
+        font_color = FontColor((1, 1, 1))
+        self.assertEqual(font_color.rgb, (1, 1, 1))
+        self.assertEqual(font_color.hex, "#010101")
+
+    def test_invalid_color(self):
+        for color in ["red", (1, 2), 5]:
+            with self.assertRaises(ValueError):
+                FontColor(color)
+
+
+class FontHandlingTest(unittest.TestCase):
+
+    MISSING_FONT = "No Such Font For PyCDXML Tests"
+
+    def test_missing_font_falls_back_to_default(self):
+        font = get_font_by_name(self.MISSING_FONT)
+        self.assertIn('cmap', font)
+
+    def test_missing_font_without_fallback(self):
+        with self.assertRaises(ValueError):
+            get_font_by_name(self.MISSING_FONT, fallback_to_default=False)
+
+    def test_text_width(self):
+        font = get_font_by_name("Arial")
+        cmap = font['cmap'].getBestCmap()
+        glyph_set = font.getGlyphSet()
+        # includes a private use character that is missing in the font
+        text = "NH3+ \ue000"
+        expected = 0
+        for c in text:
+            if ord(c) in cmap and cmap[ord(c)] in glyph_set:
+                expected += glyph_set[cmap[ord(c)]].width
+            else:
+                expected += glyph_set['.notdef'].width
+        expected = expected * 10.0 / font['head'].unitsPerEm
+        self.assertEqual(get_text_width(text, font, 10), expected)
+
+    def test_glyph_widths_released_with_font(self):
+        font = get_font_by_name("Arial")
+        get_text_width("CH3", font, 10)
+        self.assertIn(font, font_handling._GLYPH_WIDTHS)
+        font_ref = weakref.ref(font)
+        del font
+        gc.collect()
+        self.assertIsNone(font_ref())
+
+    def test_font_instances_are_not_shared(self):
+        self.assertIsNot(get_font_by_name(self.MISSING_FONT), get_font_by_name(self.MISSING_FONT))
+
+
 if __name__ == '__main__':
     unittest.main()
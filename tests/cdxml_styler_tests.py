@@ -1,5 +1,14 @@
 import unittest
+import os
+import tempfile
+import numpy as np
+from lxml import etree as ET
 from pycdxml import cdxml_styler
+from pycdxml.cdxml_converter import read_cdx, mol_to_document
+from rdkit import Chem
+from pycdxml.utils import style
+from pycdxml.utils import geometry
+from pycdxml.utils import cdxml_io
 import filecmp
 from pathlib import Path
 import logging
@@ -35,6 +44,123 @@ class CdxmlStylerTest(unittest.TestCase):
         self.assertTrue(filecmp.cmp('tests/files/single_node_reference.cdxml', self.single_node_out, shallow=False),
                         "Generated cdxml file does not match expected outcome.")
 
+    def test_style_from_xml_string(self):
+        with open("tests/files/ACS 1996.cdxml", encoding="utf8") as f:
+            template = f.read()
+        style_dict = style.get_style_from_template(template)
+        self.assertIs(type(style_dict), dict)
+        self.assertEqual(style_dict, style.get_style_from_template("tests/files/ACS 1996.cdxml"))
+
+    def test_style_from_bytes(self):
+        with open("tests/files/ACS 1996.cdxml", "rb") as f:
+            template = f.read()
+        self.assertEqual(style.cdxml_str_to_style_dict(template), style.cdxml_str_to_style_dict(template.decode("utf8")))
+
+    def test_style_from_path(self):
+        with open("tests/files/ACS 1996.cdxml", "rb") as f:
+            template = f.read()
+        self.assertEqual(style.cdxml_path_to_style_dict("tests/files/ACS 1996.cdxml"),
+                         style.cdxml_str_to_style_dict(template))
+
+    def test_style_from_path_font_table(self):
+        """
+        Test that only the fonttable of the root element is used for the label font
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            template_path = os.path.join(tmp_dir, "template.cdxml")
+            with open(template_path, "w", encoding="utf8") as f:
+                f.write('<?xml version="1.0" encoding="UTF-8" ?><CDXML LabelFont="3" BondLength="14.40"><page>'
+                        '<fonttable><font id="3" charset="iso-8859-1" name="Times New Roman"/></fonttable></page>'
+                        '<fonttable><font id="3" charset="iso-8859-1" name="Arial"/></fonttable><page/></CDXML>')
+            self.assertEqual(style.cdxml_path_to_style_dict(template_path),
+                             {"LabelFont": "Arial", "BondLength": "14.40"})
+
+            with open(template_path, "w", encoding="utf8") as f:
+                f.write('<?xml version="1.0" encoding="UTF-8" ?><CDXML LabelFont="3"><page/></CDXML>')
+            with self.assertRaises(KeyError):
+                style.cdxml_path_to_style_dict(template_path)
+
+    def test_style_from_template_path(self):
+        self.assertEqual(style.get_style_from_template(Path("tests/files/ACS 1996.cdxml")),
+                         style.get_style_from_template("tests/files/ACS 1996.cdxml"))
+        with self.assertRaises(ValueError):
+            style.get_style_from_template("tests/files")
+        with self.assertRaises(TypeError):
+            style.get_style_from_template(5)
+
+    def test_style_from_cdx_template(self):
+        cdxml = read_cdx("tests/files/standard_test.cdx").to_cdxml()
+        self.assertEqual(style.get_style_from_template("tests/files/standard_test.cdx"),
+                         style.cdxml_str_to_style_dict(cdxml))
+
+    def test_changed_template_file(self):
+        """
+        Test that a template file which is rewritten is read again and not taken from the cache
+        """
+        with open("tests/files/ACS 1996.cdxml", encoding="utf8") as f:
+            template = f.read()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            template_path = os.path.join(tmp_dir, "template.cdxml")
+            with open(template_path, "w", encoding="utf8") as f:
+                f.write(template)
+            self.assertEqual(style.get_style_from_template(template_path)["BondLength"], "14.40")
+
+            with open(template_path, "w", encoding="utf8") as f:
+                f.write(template.replace('BondLength="14.40"', 'BondLength="20"', 1))
+            # make sure the modification time differs even on file systems with a coarse resolution
+            mtime_ns = os.stat(template_path).st_mtime_ns + 10**9
+            os.utime(template_path, ns=(mtime_ns, mtime_ns))
+            self.assertEqual(style.get_style_from_template(template_path)["BondLength"], "20")
+
+    def test_apply_style_to_element(self):
+        with open(self.test_file, encoding="utf8") as f:
+            cdxml = f.read()
+        styler = cdxml_styler.CDXMLStyler(style_name="ACS 1996")
+        root = ET.fromstring(cdxml.encode("utf8"))
+        result = styler.apply_style_to_element(root)
+        self.assertIs(result, root)
+        self.assertEqual(cdxml_io.etree_to_cdxml(result, pretty_print=False), styler.apply_style_to_string(cdxml))
+
+    def test_add_missing_bounding_box(self):
+        fragment = ET.fromstring('<fragment><n p="1 6"/><n p="5 2"/><n p="3 4"/></fragment>')
+        cdxml_styler.CDXMLStyler.add_missing_bounding_box(fragment)
+        self.assertEqual(fragment.attrib["BoundingBox"], "1.0 2.0 5.0 6.0")
+
+        fragment_with_coords = ET.fromstring('<fragment><n p="1 6"/><n p="5 2"/><n p="3 4"/></fragment>')
+        all_coords = np.array([[1.0, 6.0], [5.0, 2.0], [3.0, 4.0]])
+        cdxml_styler.CDXMLStyler.add_missing_bounding_box(fragment_with_coords, all_coords)
+        self.assertEqual(fragment_with_coords.attrib["BoundingBox"], fragment.attrib["BoundingBox"])
+
+        # existing bounding box is kept
+        cdxml_styler.CDXMLStyler.add_missing_bounding_box(fragment, np.array([[0.0, 0.0], [1.0, 1.0]]))
+        self.assertEqual(fragment.attrib["BoundingBox"], "1.0 2.0 5.0 6.0")
+
+    def test_malformed_coordinates(self):
+        with open(self.test_file, encoding="utf8") as f:
+            cdxml = f.read()
+        cdxml = cdxml.replace('p="212.52 112.80"', 'p="212.52 x"', 1)
+        styler = cdxml_styler.CDXMLStyler(style_name="ACS 1996")
+        with self.assertRaises(ValueError):
+            styler.apply_style_to_string(cdxml)
+
+    def test_fix_curve_points(self):
+        curve = ET.Element("curve", CurvePoints="1 2 3.5 4.25")
+        cdxml_styler.CDXMLStyler.fix_curve_points(curve, 10, 20, 2)
+        self.assertEqual(curve.attrib["CurvePoints"], "12.0 24.0 17.0 28.5")
+        curve = ET.Element("curve", CurvePoints="1 2 x 4")
+        with self.assertRaises(ValueError):
+            cdxml_styler.CDXMLStyler.fix_curve_points(curve, 10, 20, 2)
+
+    def test_implicit_hydrogens(self):
+        cdxml = mol_to_document(Chem.MolFromSmiles("NCC(=O)[O-].[NH4+]")).to_cdxml()
+        expected = {"yes": ["N", "O", "O-", "N"], "no": ["NH2", "O", "O-", "NH4+"]}
+        for hide, labels in expected.items():
+            style_dict = dict(cdxml_styler.CDXMLStyler.get_style("ACS 1996"))
+            style_dict["HideImplicitHydrogens"] = hide
+            styler = cdxml_styler.CDXMLStyler(style_dict=style_dict)
+            root = ET.fromstring(styler.apply_style_to_string(cdxml).encode('UTF-8'))
+            self.assertEqual(["".join(s.text for s in t.iter("s")) for t in root.iter("t")], labels)
+
     def setUp(self):
         self.test_file = 'tests/files/styler_test_input.cdxml'
         self.charge_file = 'tests/files/styler_charge.cdxml'
@@ -49,5 +175,64 @@ class CdxmlStylerTest(unittest.TestCase):
             p.unlink()
 
 
+class FontTableTest(unittest.TestCase):
+
+    def test_font_lookup(self):
+        fonttable = ET.fromstring('<fonttable><font id="3" charset="iso-8859-1" name="Arial"/>'
+                                  '<font id="7" charset="iso-8859-1" name="Times New Roman"/>'
+                                  '<font id="5" charset="iso-8859-1" name="Arial"/></fonttable>')
+        font_table = style.FontTable(fonttable)
+        self.assertEqual(font_table.get_font_id("Arial"), 3)
+        self.assertEqual(font_table.get_font_id("Times New Roman"), 7)
+        self.assertIsNone(font_table.get_font_id("Helvetica"))
+        self.assertTrue(font_table.contains_font("Arial"))
+        self.assertFalse(font_table.contains_font("Helvetica"))
+        self.assertEqual(font_table.get_font_name(5), "Arial")
+
+    def test_add_font(self):
+        fonttable = ET.fromstring('<fonttable><font id="3" charset="iso-8859-1" name="Arial"/>'
+                                  '<font id="7" charset="iso-8859-1" name="Times New Roman"/></fonttable>')
+        font_table = style.FontTable(fonttable)
+        self.assertEqual(font_table.add_font("Arial"), 3)
+        self.assertEqual(font_table.add_font("Helvetica"), 8)
+        self.assertEqual(font_table.add_font("Courier"), 9)
+        self.assertEqual(font_table.add_font("Helvetica"), 8)
+        self.assertEqual(font_table.get_font_id("Courier"), 9)
+        self.assertEqual([font.attrib["id"] for font in fonttable], ["3", "7", "8", "9"])
+
+        empty_table = style.FontTable(ET.Element("fonttable"))
+        self.assertEqual(empty_table.add_font("Arial"), 1)
+
+
+class GeometryTest(unittest.TestCase):
+
+    def test_scale_translate(self):
+        coords = np.array([[1.0, 2.0], [3.5, -4.25]])
+        result = geometry.scale_translate(coords, 1.5, 10.0, -2.0)
+        np.testing.assert_array_equal(result, geometry.translate(coords * 1.5, 10.0, -2.0))
+        # input is not modified
+        np.testing.assert_array_equal(coords, np.array([[1.0, 2.0], [3.5, -4.25]]))
+
+    def test_fix_bounding_box(self):
+        element = ET.Element("t", BoundingBox="1 2 3.5 4.25")
+        geometry.fix_bounding_box(element, 10, -2, 2)
+        self.assertEqual(element.attrib["BoundingBox"], "12.0 2.0 17.0 6.5")
+        element = ET.Element("t", BoundingBox="1 2 3.5 4.25")
+        geometry.fix_bounding_box(element, 0.123, 0)
+        self.assertEqual(element.attrib["BoundingBox"], "1.12 2.0 3.62 4.25")
+
+    def test_fix_bounding_boxes(self):
+        bounding_boxes = ["1 2 3.5 4.25", "-1.5 0 7 8.123", "0.333 0.666 1 1"]
+        for scaling_factor in [None, 1.7]:
+            elements = [ET.Element("t", BoundingBox=bb) for bb in bounding_boxes]
+            expected = [ET.Element("t", BoundingBox=bb) for bb in bounding_boxes]
+            geometry.fix_bounding_boxes(elements, 3.3, -1.1, scaling_factor)
+            for element in expected:
+                geometry.fix_bounding_box(element, 3.3, -1.1, scaling_factor)
+            self.assertEqual([e.attrib["BoundingBox"] for e in elements], [e.attrib["BoundingBox"] for e in expected])
+        # nothing to do for no elements
+        geometry.fix_bounding_boxes([], 3.3, -1.1, 1.7)
+
+
 if __name__ == '__main__':
     unittest.main()